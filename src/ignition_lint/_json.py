@@ -0,0 +1,33 @@
+"""JSON parsing shared by the linters and editor tooling."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(text: str | bytes) -> Any:
+    """Parse JSON, using orjson when it is installed.
+
+    Anything orjson rejects is re-parsed by the stdlib so error messages
+    stay the same whichever parser is available, and NaN/Infinity literals
+    are still accepted.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize *obj* to compact UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
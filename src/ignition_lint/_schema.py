@@ -0,0 +1,86 @@
+"""JSON Schema validation shared by the Perspective and tag linters.
+
+Schemas, validators and fastjsonschema checks are built once per schema
+file and shared by every linter instance that uses that file.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from collections.abc import Callable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+try:
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
+
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    best_match = None  # type: ignore[assignment]
+    validator_for = None  # type: ignore[assignment]
+    JSONSCHEMA_AVAILABLE = False
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional accelerator
+    fastjsonschema = None  # type: ignore[assignment]
+
+
+@cache
+def read_schema(schema_path: Path) -> dict:
+    """Load a schema file once per process; callers must not mutate it.
+
+    ``FileNotFoundError`` and ``json.JSONDecodeError`` propagate so each
+    linter can word the error for its own schema.
+    """
+    with open(schema_path) as f:
+        return json.load(f)
+
+
+@cache
+def schema_validator(schema_path: Path):
+    """Check a schema and build its validator, or None without jsonschema.
+
+    ``jsonschema.validate`` re-checks the schema and builds a new
+    validator on every call, which dominates the cost of linting files
+    with many nodes.
+    """
+    if not JSONSCHEMA_AVAILABLE:
+        return None
+    schema = read_schema(schema_path)
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+@cache
+def fast_schema_check(schema_path: Path) -> Callable[[Any], Any] | None:
+    """Compile a schema with fastjsonschema, if it and jsonschema are installed.
+
+    The compiled check only answers "valid or not"; jsonschema still
+    produces the message for nodes that fail it.
+    """
+    if fastjsonschema is None or schema_validator(schema_path) is None:
+        return None
+    try:
+        # compile() rewrites $ref entries in place; use_default=False stops
+        # the check from filling schema defaults into the linted document
+        return fastjsonschema.compile(
+            copy.deepcopy(read_schema(schema_path)), use_default=False
+        )
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+def schema_error(validator, fast_check: Callable[[Any], Any] | None, node: Any):
+    """Return the most relevant validation error for *node*, or None if valid."""
+    if fast_check is not None:
+        try:
+            fast_check(node)
+            return None
+        except fastjsonschema.JsonSchemaException:
+            pass
+    return best_match(validator.iter_errors(node))
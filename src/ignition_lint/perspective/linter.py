@@ -19,30 +19,109 @@ import json
 import os
 import re
 import sys
+from functools import cache
 from pathlib import Path
 from typing import Any
 
-try:
-    from jsonschema import ValidationError, validate
+from .._json import loads as _loads_json
+from .._schema import (
+    JSONSCHEMA_AVAILABLE,
+    fast_schema_check,
+    read_schema,
+    schema_error,
+    schema_validator,
+)
+from ..reporting import IssueCollector, LintIssue, LintSeverity
+from ..schemas import schema_path_for as _schema_path_for
+from ..validators.expression import ExpressionValidator
+from ..validators.jython import JythonValidator
+
+
+@cache
+def _load_known_props(schema_path: Path) -> frozenset[str]:
+    """Extract known property names from the component schema.
 
-    JSONSCHEMA_AVAILABLE = True
-except ImportError:  # pragma: no cover - optional dependency
-    validate = None  # type: ignore[var-annotated]
-    JSONSCHEMA_AVAILABLE = False
+    Recursively walks the schema to collect property names from:
+    - Top-level properties
+    - definitions/components
+    - oneOf/anyOf/allOf branches
+    - additionalProperties pattern objects
 
-    class ValidationError(Exception):
-        """Fallback error when jsonschema is unavailable."""
+    Falls back to a minimal set if the schema could not be parsed. The
+    result is shared by every linter built from the same schema file.
+    """
+    schema = read_schema(schema_path)
+    props: set[str] = set()
+
+    def walk_schema(schema_node):
+        """Recursively collect property names from a schema node."""
+        if not isinstance(schema_node, dict):
+            return
+
+        # Collect from properties
+        if "properties" in schema_node:
+            schema_props = schema_node.get("properties", {})
+            if isinstance(schema_props, dict):
+                props.update(schema_props.keys())
+
+        # Walk definitions
+        if "definitions" in schema_node:
+            definitions = schema_node.get("definitions", {})
+            if isinstance(definitions, dict):
+                for defn in definitions.values():
+                    walk_schema(defn)
+
+        # Walk oneOf/anyOf/allOf branches
+        for key in ("oneOf", "anyOf", "allOf"):
+            if key in schema_node:
+                branches = schema_node.get(key, [])
+                if isinstance(branches, list):
+                    for branch in branches:
+                        walk_schema(branch)
+
+        # Walk additionalProperties if it's a schema object
+        if "additionalProperties" in schema_node:
+            additional = schema_node.get("additionalProperties")
+            if isinstance(additional, dict):
+                walk_schema(additional)
+
+    try:
+        # Start from top-level props.properties
+        schema_props = (
+            schema.get("properties", {}).get("props", {}).get("properties", {})
+        )
+        props.update(schema_props.keys())
 
+        # Also walk the entire schema for definitions
+        walk_schema(schema)
+
+        # Add supplementary allowlist for common cross-component properties
+        supplementary = {"fit", "tagPath", "viewPath", "source", "alt", "path"}
+        props.update(supplementary)
+
+    except (AttributeError, TypeError):
         pass
 
+    if not props:
+        # Minimal fallback when schema is unavailable
+        props = {"style", "text", "value", "enabled", "visible"}
+
+    return frozenset(props)
 
-from ..reporting import LintIssue, LintSeverity
-from ..schemas import schema_path_for as _schema_path_for
-from ..validators.expression import ExpressionValidator
-from ..validators.jython import JythonValidator
 
+@cache
+def _load_component_props() -> dict[str, frozenset[str]]:
+    """Load per-component property map from component-props.json."""
+    comp_props_path = Path(__file__).parent.parent / "schemas" / "component-props.json"
+    try:
+        with open(comp_props_path) as f:
+            raw = json.load(f)
+        return {k: frozenset(v) for k, v in raw.items()}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
 
-class IgnitionPerspectiveLinter:
+
+class IgnitionPerspectiveLinter(IssueCollector):
     def __init__(self, schema_path: str = None):
         """Initialize the linter with the component schema."""
         if schema_path is None:
@@ -51,8 +130,10 @@ class IgnitionPerspectiveLinter:
             schema_path = Path(schema_path)
 
         self.schema_path = schema_path
-        self.jsonschema_available = JSONSCHEMA_AVAILABLE and validate is not None
+        self.jsonschema_available = JSONSCHEMA_AVAILABLE
         self.schema = self._load_schema(schema_path)
+        self._schema_validator = schema_validator(schema_path)
+        self._fast_schema_check = fast_schema_check(schema_path)
         self.issues: list[LintIssue] = []
         self.component_stats = {
             "total_files": 0,
@@ -64,8 +145,9 @@ class IgnitionPerspectiveLinter:
         self._missing_schema_files: set[str] = set()
         self.jython_validator = JythonValidator()
         self.expression_validator = ExpressionValidator()
-        self.known_prop_names = self._extract_known_props()
-        self._component_props = self._load_component_props()
+        self.known_prop_names = _load_known_props(schema_path)
+        self._component_props = _load_component_props()
+        self._known_props_by_type: dict[str, frozenset[str]] = {}
 
         # Known best practices patterns
         self.best_practices = {
@@ -82,93 +164,20 @@ class IgnitionPerspectiveLinter:
     def _load_schema(self, schema_path: str) -> dict:
         """Load the JSON schema for validation."""
         try:
-            with open(schema_path) as f:
-                return json.load(f)
+            return read_schema(Path(schema_path))
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Schema file not found: {schema_path}") from e
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in schema file: {schema_path}: {e}") from e
 
-    def _extract_known_props(self) -> frozenset:
-        """Extract known property names from the loaded component schema.
-
-        Recursively walks the schema to collect property names from:
-        - Top-level properties
-        - definitions/components
-        - oneOf/anyOf/allOf branches
-        - additionalProperties pattern objects
+    def warmup(self) -> None:
+        """Precompute per-type prop sets so the first lint pays no setup cost.
 
-        Falls back to a minimal set if the schema could not be parsed.
+        Long-lived callers such as editor integrations call this once at
+        startup; the schema validator itself is already built in __init__.
         """
-        props: set[str] = set()
-
-        def walk_schema(schema_node):
-            """Recursively collect property names from a schema node."""
-            if not isinstance(schema_node, dict):
-                return
-
-            # Collect from properties
-            if "properties" in schema_node:
-                schema_props = schema_node.get("properties", {})
-                if isinstance(schema_props, dict):
-                    props.update(schema_props.keys())
-
-            # Walk definitions
-            if "definitions" in schema_node:
-                definitions = schema_node.get("definitions", {})
-                if isinstance(definitions, dict):
-                    for defn in definitions.values():
-                        walk_schema(defn)
-
-            # Walk oneOf/anyOf/allOf branches
-            for key in ("oneOf", "anyOf", "allOf"):
-                if key in schema_node:
-                    branches = schema_node.get(key, [])
-                    if isinstance(branches, list):
-                        for branch in branches:
-                            walk_schema(branch)
-
-            # Walk additionalProperties if it's a schema object
-            if "additionalProperties" in schema_node:
-                additional = schema_node.get("additionalProperties")
-                if isinstance(additional, dict):
-                    walk_schema(additional)
-
-        try:
-            # Start from top-level props.properties
-            schema_props = (
-                self.schema.get("properties", {}).get("props", {}).get("properties", {})
-            )
-            props.update(schema_props.keys())
-
-            # Also walk the entire schema for definitions
-            walk_schema(self.schema)
-
-            # Add supplementary allowlist for common cross-component properties
-            supplementary = {"fit", "tagPath", "viewPath", "source", "alt", "path"}
-            props.update(supplementary)
-
-        except (AttributeError, TypeError):
-            pass
-
-        if not props:
-            # Minimal fallback when schema is unavailable
-            props = {"style", "text", "value", "enabled", "visible"}
-
-        return frozenset(props)
-
-    @staticmethod
-    def _load_component_props() -> dict[str, frozenset[str]]:
-        """Load per-component property map from component-props.json."""
-        comp_props_path = (
-            Path(__file__).parent.parent / "schemas" / "component-props.json"
-        )
-        try:
-            with open(comp_props_path) as f:
-                raw = json.load(f)
-            return {k: frozenset(v) for k, v in raw.items()}
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+        for comp_type in self._component_props:
+            self._get_known_props_for_type(comp_type)
 
     def _get_known_props_for_type(self, comp_type: str) -> frozenset[str]:
         """Return known properties for a specific component type.
@@ -176,8 +185,12 @@ class IgnitionPerspectiveLinter:
         Merges component-specific props with generic schema props.
         Falls back to generic-only for unknown component types.
         """
-        type_specific = self._component_props.get(comp_type, frozenset())
-        return self.known_prop_names | type_specific
+        known = self._known_props_by_type.get(comp_type)
+        if known is None:
+            type_specific = self._component_props.get(comp_type, frozenset())
+            known = self.known_prop_names | type_specific
+            self._known_props_by_type[comp_type] = known
+        return known
 
     def find_view_files(self, target_path: str) -> list[str]:
         """Find all view.json files in the target directory."""
@@ -231,7 +244,7 @@ class IgnitionPerspectiveLinter:
         self, component: dict, file_path: str, component_path: str
     ) -> bool:
         """Validate a component against the schema."""
-        if not self.jsonschema_available or validate is None:
+        if self._schema_validator is None:
             if file_path not in self._missing_schema_files:
                 self._missing_schema_files.add(file_path)
                 self.issues.append(
@@ -247,24 +260,25 @@ class IgnitionPerspectiveLinter:
                 )
             return True
 
-        try:
-            validate(instance=component, schema=self.schema)
+        error = schema_error(self._schema_validator, self._fast_schema_check, component)
+        if error is None:
             return True
-        except ValidationError as e:
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.ERROR,
-                    code="SCHEMA_VALIDATION",
-                    message=f"Schema validation failed: {e.message}",
-                    file_path=file_path,
-                    component_path=component_path,
-                    component_type=component.get("type", "unknown"),
-                    suggestion=f"Path: {'.'.join(map(str, e.absolute_path))}"
-                    if e.absolute_path
-                    else None,
-                )
+        self.issues.append(
+            LintIssue(
+                severity=LintSeverity.ERROR,
+                code="SCHEMA_VALIDATION",
+                message=f"Schema validation failed: {error.message}",
+                file_path=file_path,
+                component_path=component_path,
+                component_type=component.get("type", "unknown"),
+                suggestion=(
+                    f"Path: {'.'.join(map(str, error.absolute_path))}"
+                    if error.absolute_path
+                    else None
+                ),
             )
-            return False
+        )
+        return False
 
     def check_component_best_practices(
         self, component: dict, file_path: str, component_path: str
@@ -1703,38 +1717,51 @@ class IgnitionPerspectiveLinter:
         self, file_path: str, target_component_type: str | None = None
     ) -> bool:
         """Lint a single view.json file."""
-        # Track starting index for issues so we only enrich new ones
-        issues_start_idx = len(self.issues)
-
         try:
             with open(file_path, encoding="utf-8") as f:
                 raw_text = f.read()
-            view_data = json.loads(raw_text)
+            view_data = _loads_json(raw_text)
         except json.JSONDecodeError as e:
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.ERROR,
-                    code="INVALID_JSON",
-                    message=f"Invalid JSON format: {e}",
-                    file_path=file_path,
-                    component_path="file",
-                    component_type="view",
-                    suggestion=f"Line {e.lineno}: {e.msg}",
-                )
+            issue = LintIssue(
+                severity=LintSeverity.ERROR,
+                code="INVALID_JSON",
+                message=f"Invalid JSON format: {e}",
+                file_path=file_path,
+                component_path="file",
+                component_type="view",
+                suggestion=f"Line {e.lineno}: {e.msg}",
             )
-            return False
         except Exception as e:
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.ERROR,
-                    code="FILE_READ_ERROR",
-                    message=f"Could not read file: {e}",
-                    file_path=file_path,
-                    component_path="file",
-                    component_type="view",
-                )
+            issue = LintIssue(
+                severity=LintSeverity.ERROR,
+                code="FILE_READ_ERROR",
+                message=f"Could not read file: {e}",
+                file_path=file_path,
+                component_path="file",
+                component_type="view",
             )
-            return False
+        else:
+            return self.lint_data(view_data, file_path, target_component_type, raw_text)
+
+        self.component_stats["total_files"] += 1
+        self.issues.append(issue)
+        return False
+
+    def lint_data(
+        self,
+        view_data: dict[str, Any],
+        file_path: str = "<memory>",
+        target_component_type: str | None = None,
+        raw_text: str | None = None,
+    ) -> bool:
+        """Lint an already-parsed view document.
+
+        ``file_path`` is only used to label issues. Line numbers are filled
+        in when the view's source text is passed as ``raw_text``.
+        """
+        self.component_stats["total_files"] += 1
+        # Track starting index for issues so we only enrich new ones
+        issues_start_idx = len(self.issues)
 
         # Validate view-level propConfig (onChange scripts, transform scripts, expressions)
         view_prop_config = view_data.get("propConfig", {})
@@ -1816,10 +1843,11 @@ class IgnitionPerspectiveLinter:
         self._validate_binding_paths(view_data, file_path)
 
         # Enrich line numbers for all issues generated during this lint
-        line_map = self._build_component_line_map(raw_text)
-        self._enrich_issue_line_numbers(
-            self.issues, line_map, issues_start_idx, raw_text
-        )
+        if raw_text is not None:
+            line_map = self._build_component_line_map(raw_text)
+            self._enrich_issue_line_numbers(
+                self.issues, line_map, issues_start_idx, raw_text
+            )
 
         return file_valid
 
@@ -1847,7 +1875,6 @@ class IgnitionPerspectiveLinter:
 
         print(f"📁 Found {len(view_files)} view files", file=sys.stderr)
 
-        self.component_stats["total_files"] = len(view_files)
         valid_files = 0
 
         for i, file_path in enumerate(view_files, 1):
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class PropertyDef:
     """A custom or param property defined on a view."""
 
@@ -15,7 +15,7 @@ class PropertyDef:
     default_value: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BindingNode:
     """A binding extracted from a view's propConfig tree."""
 
@@ -30,7 +30,7 @@ class BindingNode:
     component_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptNode:
     """A script extracted from a view (event handler, onChange, or transform)."""
 
@@ -40,7 +40,7 @@ class ScriptNode:
     component_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionNode:
     """An expression extracted from a binding or transform."""
 
@@ -49,7 +49,7 @@ class ExpressionNode:
     component_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ViewModel:
     """Flattened representation of an Ignition Perspective view."""
 
@@ -187,66 +187,68 @@ def _extract_from_tree(
     scripts: list[ScriptNode],
     expressions: list[ExpressionNode],
 ) -> None:
-    """Walk the component tree extracting events and propConfig."""
-    if not isinstance(obj, dict):
-        return
-
-    if (
-        "type" in obj
-        and isinstance(obj.get("type"), str)
-        and obj["type"].startswith("ia.")
-    ):
-        components.append(obj)
-
-    # propConfig
-    prop_config = obj.get("propConfig", {})
-    if isinstance(prop_config, dict):
-        _extract_from_propconfig(prop_config, path, bindings, scripts, expressions)
-
-    # Event scripts
-    events = obj.get("events", {})
-    if isinstance(events, dict):
-        for category, handlers in events.items():
-            if not isinstance(handlers, dict):
-                continue
-            for event_name, handler_config in handlers.items():
-                handlers_list = (
-                    handler_config
-                    if isinstance(handler_config, list)
-                    else [handler_config]
-                )
-                for j, handler in enumerate(handlers_list):
-                    if isinstance(handler, dict) and handler.get("type") == "script":
-                        code = handler.get("config", {}).get("script", "")
-                        if code:
-                            scripts.append(
-                                ScriptNode(
-                                    content=code,
-                                    location=f"{path}.events.{category}.{event_name}[{j}]",
-                                    script_type="event",
-                                    component_path=path,
+    """Walk the component tree extracting events and propConfig.
+
+    Nodes are visited depth-first in document order (each node, then its
+    ``children``, then its ``root``) using an explicit stack, so deeply
+    nested views cost no Python recursion.
+    """
+    stack: list[tuple[Any, str]] = [(obj, path)]
+    while stack:
+        obj, path = stack.pop()
+        if not isinstance(obj, dict):
+            continue
+
+        if (
+            "type" in obj
+            and isinstance(obj.get("type"), str)
+            and obj["type"].startswith("ia.")
+        ):
+            components.append(obj)
+
+        # propConfig
+        prop_config = obj.get("propConfig", {})
+        if isinstance(prop_config, dict):
+            _extract_from_propconfig(prop_config, path, bindings, scripts, expressions)
+
+        # Event scripts
+        events = obj.get("events", {})
+        if isinstance(events, dict):
+            for category, handlers in events.items():
+                if not isinstance(handlers, dict):
+                    continue
+                for event_name, handler_config in handlers.items():
+                    handlers_list = (
+                        handler_config
+                        if isinstance(handler_config, list)
+                        else [handler_config]
+                    )
+                    for j, handler in enumerate(handlers_list):
+                        if (
+                            isinstance(handler, dict)
+                            and handler.get("type") == "script"
+                        ):
+                            code = handler.get("config", {}).get("script", "")
+                            if code:
+                                scripts.append(
+                                    ScriptNode(
+                                        content=code,
+                                        location=f"{path}.events.{category}.{event_name}[{j}]",
+                                        script_type="event",
+                                        component_path=path,
+                                    )
                                 )
-                            )
 
-    # Recurse into children
-    children = obj.get("children", [])
-    if isinstance(children, list):
-        for i, child in enumerate(children):
-            _extract_from_tree(
-                child,
-                f"{path}.children[{i}]",
-                components,
-                bindings,
-                scripts,
-                expressions,
+        # Push "root" first and children in reverse so they pop in order
+        if "root" in obj:
+            stack.append((obj["root"], f"{path}.root"))
+        children = obj.get("children", [])
+        if isinstance(children, list):
+            stack.extend(
+                (child, f"{path}.children[{i}]")
+                for i, child in reversed(list(enumerate(children)))
             )
 
-    # Recurse into root
-    if "root" in obj:
-        _extract_from_tree(
-            obj["root"], f"{path}.root", components, bindings, scripts, expressions
-        )
-
 
 def build_view_model(view_data: dict[str, Any], file_path: str) -> ViewModel:
     """Build a flattened ViewModel from raw view.json data."""
@@ -54,6 +54,33 @@ class LintIssue:
     metadata: dict[str, str] = field(default_factory=dict)
 
 
+class IssueCollector:
+    """Mixin for linters that collect issues in ``self.issues``.
+
+    The code views are rebuilt on every access, so they stay correct however
+    ``issues`` is changed.
+    """
+
+    issues: list[LintIssue]
+
+    def reset(self) -> None:
+        """Clear collected issues so the linter can be reused for a new run."""
+        self.issues.clear()
+
+    @property
+    def codes(self) -> frozenset[str]:
+        """Set of issue codes collected so far."""
+        return frozenset(issue.code for issue in self.issues)
+
+    @property
+    def issues_by_code(self) -> dict[str, list[LintIssue]]:
+        """Collected issues grouped by code, in emission order."""
+        grouped: dict[str, list[LintIssue]] = {}
+        for issue in self.issues:
+            grouped.setdefault(issue.code, []).append(issue)
+        return grouped
+
+
 @dataclass
 class LintReport:
     """Aggregate linting results used across modules."""
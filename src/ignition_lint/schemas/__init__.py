@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 
 SCHEMA_FILES = {
@@ -17,8 +18,12 @@ TAG_SCHEMA_FILES = {
 _SCHEMA_DIR = Path(__file__).parent
 
 
+@cache
 def schema_path_for(mode: str) -> Path:
-    """Return the absolute path to the Perspective schema file for the given mode."""
+    """Return the absolute path to the Perspective schema file for the given mode.
+
+    Results are memoized; unknown modes raise and are never cached.
+    """
     normalized = mode.lower()
     if normalized not in SCHEMA_FILES:
         raise ValueError(
@@ -27,6 +32,7 @@ def schema_path_for(mode: str) -> Path:
     return _SCHEMA_DIR / SCHEMA_FILES[normalized]
 
 
+@cache
 def tag_schema_path_for(mode: str) -> Path:
     """Return the absolute path to the tag schema file for the given mode."""
     normalized = mode.lower()
@@ -392,11 +392,10 @@ class IgnitionScriptLinter:
                     )
                 )
 
-        # Validate system function calls
+        # Validate system function calls; startswith() takes every module at once
+        module_prefixes = tuple(self.ignition_system_modules)
         for call in system_calls:
-            if not any(
-                call.startswith(module) for module in self.ignition_system_modules
-            ):
+            if not call.startswith(module_prefixes):
                 # Check if it's a known valid call or potentially invalid
                 parts = call.split(".")
                 if len(parts) >= 2:
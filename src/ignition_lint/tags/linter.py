@@ -7,26 +7,28 @@ UDT instances, misconfigured value sources, and unknown property names.
 
 import json
 import re
+from collections.abc import Callable
 from pathlib import Path
-
-try:
-    from jsonschema import ValidationError, validate
-
-    JSONSCHEMA_AVAILABLE = True
-except ImportError:  # pragma: no cover - optional dependency
-    validate = None  # type: ignore[var-annotated]
-    JSONSCHEMA_AVAILABLE = False
-
-    class ValidationError(Exception):  # type: ignore[no-redef]
-        """Fallback error when jsonschema is unavailable."""
-
-        pass
-
-
-from ..reporting import LintIssue, LintSeverity
+from typing import ClassVar
+
+from .._json import loads as _loads_json
+from .._schema import (
+    JSONSCHEMA_AVAILABLE,
+    fast_schema_check,
+    read_schema,
+    schema_error,
+    schema_validator,
+)
+from ..reporting import IssueCollector, LintIssue, LintSeverity
 from ..schemas import tag_schema_path_for as _tag_schema_path_for
 from ..validators.jython import JythonValidator
 
+# Accepted tagType values
+_VALID_TAG_TYPES = frozenset(
+    {"AtomicTag", "UdtType", "UdtInstance", "Folder", "Provider"}
+)
+_VALID_TAG_TYPES_HINT = f"Valid values: {', '.join(sorted(_VALID_TAG_TYPES))}"
+
 # Keys that are present on every tagType (shared base)
 _SHARED_TAG_KEYS = frozenset(
     {
@@ -41,7 +43,7 @@ _SHARED_TAG_KEYS = frozenset(
 )
 
 
-class IgnitionTagLinter:
+class IgnitionTagLinter(IssueCollector):
     """Lint Ignition tag/UDT JSON files for structural and best-practice issues."""
 
     def __init__(self, schema_path: str | None = None):
@@ -51,8 +53,11 @@ class IgnitionTagLinter:
             schema_path = Path(schema_path)
 
         self.schema_path = schema_path
-        self.jsonschema_available = JSONSCHEMA_AVAILABLE and validate is not None
+        self.jsonschema_available = JSONSCHEMA_AVAILABLE
         self.schema = self._load_schema(schema_path)
+        self._schema_validator = schema_validator(schema_path)
+        self._fast_schema_check = fast_schema_check(schema_path)
+        self._schema_checks_children = self._schema_recurses_into_tags(self.schema)
         self.issues: list[LintIssue] = []
         self.tag_stats = {
             "total_files": 0,
@@ -71,8 +76,7 @@ class IgnitionTagLinter:
     @staticmethod
     def _load_schema(schema_path: str | Path) -> dict:
         try:
-            with open(schema_path) as f:
-                return json.load(f)
+            return read_schema(Path(schema_path))
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Tag schema file not found: {schema_path}") from e
         except json.JSONDecodeError as e:
@@ -80,6 +84,21 @@ class IgnitionTagLinter:
                 f"Invalid JSON in tag schema file: {schema_path}: {e}"
             ) from e
 
+    @staticmethod
+    def _schema_recurses_into_tags(schema: dict) -> bool:
+        """Return True if the schema validates ``tags`` entries with its root rule.
+
+        When it does, a node that passes validation vouches for its whole
+        subtree and the walker need not validate the children again.
+        """
+        try:
+            root_ref = schema["$ref"]
+            node_def = schema["definitions"][root_ref.rpartition("/")[2]]
+            items = node_def["properties"]["tags"]["items"]
+        except (KeyError, TypeError, AttributeError):
+            return False
+        return isinstance(items, dict) and items.get("$ref") == root_ref
+
     def _extract_known_atomic_props(self) -> frozenset:
         """Extract known AtomicTag property names from the loaded schema."""
         props: set[str] = set()
@@ -106,95 +125,166 @@ class IgnitionTagLinter:
 
         return frozenset(props)
 
+    # ------------------------------------------------------------------
+    # Issue bookkeeping
+    # ------------------------------------------------------------------
+
+    def _drop_duplicate_issues(self, start: int) -> None:
+        """Drop repeats among the issues appended since ``start``.
+
+        Two event scripts that share an id would otherwise report one defect
+        several times. Only the current lint call is considered, so linting
+        the same document again reports its issues again.
+        """
+        # (file_path, code, component_path, line_number, message) per issue
+        seen: set[tuple] = set()
+        kept = []
+        for issue in self.issues[start:]:
+            key = (
+                issue.file_path,
+                issue.code,
+                issue.component_path,
+                issue.line_number,
+                issue.message,
+            )
+            if key not in seen:
+                seen.add(key)
+                kept.append(issue)
+        self.issues[start:] = kept
+
     # ------------------------------------------------------------------
     # Main entry point
     # ------------------------------------------------------------------
 
     def lint_file(self, file_path: str) -> bool:
         """Lint a single tag JSON file. Returns True if the file is valid."""
-        self.tag_stats["total_files"] += 1
-
         try:
             with open(file_path, encoding="utf-8") as f:
                 raw_text = f.read()
-            data = json.loads(raw_text)
+            data = _loads_json(raw_text)
         except json.JSONDecodeError as e:
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.ERROR,
-                    code="INVALID_JSON",
-                    message=f"Invalid JSON format: {e}",
-                    file_path=file_path,
-                    component_path="file",
-                    component_type="tag",
-                    suggestion=f"Line {e.lineno}: {e.msg}",
-                )
+            issue = LintIssue(
+                severity=LintSeverity.ERROR,
+                code="INVALID_JSON",
+                message=f"Invalid JSON format: {e}",
+                file_path=file_path,
+                component_path="file",
+                component_type="tag",
+                suggestion=f"Line {e.lineno}: {e.msg}",
             )
-            return False
         except Exception as e:
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.ERROR,
-                    code="FILE_READ_ERROR",
-                    message=f"Could not read file: {e}",
-                    file_path=file_path,
-                    component_path="file",
-                    component_type="tag",
-                )
+            issue = LintIssue(
+                severity=LintSeverity.ERROR,
+                code="FILE_READ_ERROR",
+                message=f"Could not read file: {e}",
+                file_path=file_path,
+                component_path="file",
+                component_type="tag",
             )
-            return False
+        else:
+            return self.lint_data(data, file_path, raw_text)
+
+        self.tag_stats["total_files"] += 1
+        self.issues.append(issue)
+        return False
+
+    def lint_data(
+        self, data, file_path: str = "<memory>", raw_text: str | None = None
+    ) -> bool:
+        """Lint an already-parsed tag document. Returns True if it is valid.
 
-        line_map = self._build_tag_line_map(raw_text)
+        ``file_path`` is only used to label issues. Line numbers are filled
+        in when the document's source text is passed as ``raw_text``.
+        """
+        self.tag_stats["total_files"] += 1
         issues_start = len(self.issues)
 
+        # A scalar document holds no tags; reject it without scanning lines
+        if not isinstance(data, (dict, list)):
+            self._report_invalid_tag_node(data, file_path, "")
+            self._drop_duplicate_issues(issues_start)
+            return False
+
         # Walk the tag tree
         if isinstance(data, list):
             # Handle top-level arrays (common in tag exports)
-            file_valid = True
-            for i, entry in enumerate(data):
-                if not self._validate_tag_node(entry, file_path, f"[{i}]"):
-                    file_valid = False
+            entries = self._split_malformed_children(data, file_path, "")
+            file_valid = len(entries) == len(data)
         else:
             # Single tag node
-            file_valid = self._validate_tag_node(data, file_path, "")
+            entries = [("", data)]
+            file_valid = True
+        file_valid = self._walk_tag_tree(entries, file_path) and file_valid
 
-        # Enrich issues with line numbers
-        self._enrich_issue_line_numbers(self.issues, line_map, issues_start, raw_text)
+        # Enrich issues with line numbers (the line map is only needed then)
+        if raw_text is not None and len(self.issues) > issues_start:
+            line_map = self._build_tag_line_map(raw_text)
+            self._enrich_issue_line_numbers(
+                self.issues, line_map, issues_start, raw_text
+            )
+        self._drop_duplicate_issues(issues_start)
 
         return file_valid
 
     # ------------------------------------------------------------------
-    # Recursive tag walker
+    # Tag tree walker
     # ------------------------------------------------------------------
 
+    def _walk_tag_tree(self, entries: list[tuple[str, dict]], file_path: str) -> bool:
+        """Validate every node under ``entries`` in document order.
+
+        Uses an explicit stack instead of recursion so deeply nested
+        folder/UDT trees cannot hit the interpreter's recursion limit.
+        Returns False if any node failed schema validation or any ``tags``
+        list held a non-dict entry.
+        """
+        all_valid = True
+        # (tag_path, node, inside_udt_instance, schema_checked)
+        stack = [(path, node, False, False) for path, node in reversed(entries)]
+        while stack:
+            tag_path, node, inside_udt_instance, schema_checked = stack.pop()
+            tag_name = node.get("name", "")
+            current_path = f"{tag_path}/{tag_name}" if tag_path else tag_name
+
+            schema_valid = self._validate_tag_node(
+                node, file_path, current_path, inside_udt_instance, schema_checked
+            )
+            if not schema_valid:
+                all_valid = False
+
+            tags = node.get("tags")
+            if not isinstance(tags, list):
+                continue
+            children = self._split_malformed_children(
+                tags, file_path, f"{current_path}/tags"
+            )
+            if len(children) != len(tags):
+                all_valid = False
+            child_inside_udt = (
+                inside_udt_instance or node.get("tagType", "") == "UdtInstance"
+            )
+            child_schema_checked = schema_valid and self._schema_checks_children
+            # Push in reverse so children pop in document order
+            stack.extend(
+                (child_path, child, child_inside_udt, child_schema_checked)
+                for child_path, child in reversed(children)
+            )
+
+        return all_valid
+
     def _validate_tag_node(
         self,
         node: dict,
         file_path: str,
         tag_path: str,
         inside_udt_instance: bool = False,
+        schema_checked: bool = False,
     ) -> bool:
-        """Validate a single tag node and recurse into children."""
-        if not isinstance(node, dict):
-            # Report error for malformed tag entries
-            node_type = type(node).__name__
-            node_repr = repr(node) if len(repr(node)) < 50 else repr(node)[:47] + "..."
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.ERROR,
-                    code="INVALID_TAG_NODE",
-                    message=f"Tag node must be a dict/object, got {node_type}: {node_repr}",
-                    file_path=file_path,
-                    component_path=tag_path or "root",
-                    component_type="invalid",
-                    suggestion="Each tag must be a JSON object with 'name', 'tagType', etc.",
-                )
-            )
-            self.tag_stats["invalid_tags"] += 1
-            return False
+        """Run all checks on a single tag node; returns its schema validity.
 
-        tag_name = node.get("name", "")
-        current_path = f"{tag_path}/{tag_name}" if tag_path else tag_name
+        ``schema_checked`` is set when an ancestor already passed schema
+        validation, which covered this node too.
+        """
         tag_type = node.get("tagType", "")
 
         self.tag_stats["total_tags"] += 1
@@ -202,35 +292,57 @@ class IgnitionTagLinter:
             self.tag_stats["tag_types"].add(tag_type)
 
         # Schema validation
-        schema_valid = self._validate_tag_schema(node, file_path, current_path)
+        schema_valid = schema_checked or self._validate_tag_schema(
+            node, file_path, tag_path
+        )
 
         # Best practices checks
-        self._check_tag_best_practices(
-            node, file_path, current_path, inside_udt_instance
-        )
+        self._check_tag_best_practices(node, file_path, tag_path, inside_udt_instance)
 
         # Event script validation
-        self._validate_event_scripts(node, file_path, current_path)
+        self._validate_event_scripts(node, file_path, tag_path)
 
         if schema_valid:
             self.tag_stats["valid_tags"] += 1
         else:
             self.tag_stats["invalid_tags"] += 1
 
-        # Recurse into child tags
-        tags = node.get("tags")
-        node_valid = schema_valid
-        if isinstance(tags, list):
-            child_inside_udt = inside_udt_instance or tag_type == "UdtInstance"
-            for i, child in enumerate(tags):
-                child_path = f"{current_path}/tags[{i}]"
-                child_valid = self._validate_tag_node(
-                    child, file_path, child_path, child_inside_udt
-                )
-                if not child_valid:
-                    node_valid = False
-
-        return node_valid
+        return schema_valid
+
+    def _split_malformed_children(
+        self, entries: list, file_path: str, list_path: str
+    ) -> list[tuple[str, dict]]:
+        """Report non-dict entries up front and return the well-formed ones.
+
+        A single ``isinstance`` sweep keeps semantic validation off the
+        malformed entries entirely; indices in the returned paths still
+        refer to positions in the original list.
+        """
+        children: list[tuple[str, dict]] = []
+        for i, entry in enumerate(entries):
+            entry_path = f"{list_path}[{i}]"
+            if isinstance(entry, dict):
+                children.append((entry_path, entry))
+            else:
+                self._report_invalid_tag_node(entry, file_path, entry_path)
+        return children
+
+    def _report_invalid_tag_node(self, node, file_path: str, tag_path: str) -> None:
+        """Record an INVALID_TAG_NODE error for a non-dict tag entry."""
+        node_type = type(node).__name__
+        node_repr = repr(node) if len(repr(node)) < 50 else repr(node)[:47] + "..."
+        self.issues.append(
+            LintIssue(
+                severity=LintSeverity.ERROR,
+                code="INVALID_TAG_NODE",
+                message=f"Tag node must be a dict/object, got {node_type}: {node_repr}",
+                file_path=file_path,
+                component_path=tag_path or "root",
+                component_type="invalid",
+                suggestion="Each tag must be a JSON object with 'name', 'tagType', etc.",
+            )
+        )
+        self.tag_stats["invalid_tags"] += 1
 
     # ------------------------------------------------------------------
     # Schema validation
@@ -238,45 +350,44 @@ class IgnitionTagLinter:
 
     def _validate_tag_schema(self, node: dict, file_path: str, tag_path: str) -> bool:
         """Validate a tag node against the JSON schema."""
-        if not self.jsonschema_available or validate is None:
+        if self._schema_validator is None:
             return True
 
-        try:
-            validate(instance=node, schema=self.schema)
+        error = schema_error(self._schema_validator, self._fast_schema_check, node)
+        if error is None:
             return True
-        except ValidationError as e:
-            metadata: dict[str, str] = {}
-            if e.absolute_path:
-                path_parts = list(e.absolute_path)
-                search_prop = None
-                for part in reversed(path_parts):
-                    if isinstance(part, str):
-                        search_prop = part
-                        break
-                if search_prop:
-                    metadata["search_key"] = f'"{search_prop}"'
-
-            tag_name = node.get("name", "")
-            if tag_name:
-                metadata["tag_name"] = tag_name
+        metadata: dict[str, str] = {}
+        if error.absolute_path:
+            path_parts = list(error.absolute_path)
+            search_prop = None
+            for part in reversed(path_parts):
+                if isinstance(part, str):
+                    search_prop = part
+                    break
+            if search_prop:
+                metadata["search_key"] = f'"{search_prop}"'
 
-            self.issues.append(
-                LintIssue(
-                    severity=LintSeverity.ERROR,
-                    code="SCHEMA_VALIDATION",
-                    message=f"Schema validation failed: {e.message}",
-                    file_path=file_path,
-                    component_path=tag_path,
-                    component_type=node.get("tagType", "unknown"),
-                    suggestion=(
-                        f"Path: {'.'.join(map(str, e.absolute_path))}"
-                        if e.absolute_path
-                        else None
-                    ),
-                    metadata=metadata,
-                )
+        tag_name = node.get("name", "")
+        if tag_name:
+            metadata["tag_name"] = tag_name
+
+        self.issues.append(
+            LintIssue(
+                severity=LintSeverity.ERROR,
+                code="SCHEMA_VALIDATION",
+                message=f"Schema validation failed: {error.message}",
+                file_path=file_path,
+                component_path=tag_path,
+                component_type=node.get("tagType", "unknown"),
+                suggestion=(
+                    f"Path: {'.'.join(map(str, error.absolute_path))}"
+                    if error.absolute_path
+                    else None
+                ),
+                metadata=metadata,
             )
-            return False
+        )
+        return False
 
     # ------------------------------------------------------------------
     # Best practices
@@ -313,8 +424,7 @@ class IgnitionTagLinter:
             )
 
         # INVALID_TAG_TYPE
-        valid_tag_types = {"AtomicTag", "UdtType", "UdtInstance", "Folder", "Provider"}
-        if tag_type and tag_type not in valid_tag_types:
+        if tag_type and tag_type not in _VALID_TAG_TYPES:
             self.issues.append(
                 LintIssue(
                     severity=LintSeverity.ERROR,
@@ -323,7 +433,7 @@ class IgnitionTagLinter:
                     file_path=file_path,
                     component_path=tag_path,
                     component_type=tag_type,
-                    suggestion=f"Valid values: {', '.join(sorted(valid_tag_types))}",
+                    suggestion=_VALID_TAG_TYPES_HINT,
                     metadata={**base_metadata, "search_key": '"tagType"'},
                 )
             )
@@ -359,61 +469,14 @@ class IgnitionTagLinter:
                     )
                 )
 
-            value_source = node.get("valueSource", "")
-
-            # OPC_MISSING_CONFIG
-            if value_source == "opc":
-                if "opcServer" not in node or "opcItemPath" not in node:
-                    missing_fields = []
-                    if "opcServer" not in node:
-                        missing_fields.append("'opcServer'")
-                    if "opcItemPath" not in node:
-                        missing_fields.append("'opcItemPath'")
-
-                    self.issues.append(
-                        LintIssue(
-                            severity=LintSeverity.WARNING,
-                            code="OPC_MISSING_CONFIG",
-                            message=f"OPC tag is missing {' and '.join(missing_fields)}",
-                            file_path=file_path,
-                            component_path=tag_path,
-                            component_type=tag_type,
-                            suggestion="Add 'opcServer' and 'opcItemPath' properties",
-                            metadata={**base_metadata, "search_key": '"valueSource"'},
-                        )
-                    )
-
-            # EXPR_MISSING_EXPRESSION
-            if value_source == "expr":
-                if "expression" not in node:
-                    self.issues.append(
-                        LintIssue(
-                            severity=LintSeverity.ERROR,
-                            code="EXPR_MISSING_EXPRESSION",
-                            message="Expression tag is missing 'expression' property",
-                            file_path=file_path,
-                            component_path=tag_path,
-                            component_type=tag_type,
-                            suggestion="Add an 'expression' property",
-                            metadata={**base_metadata, "search_key": '"valueSource"'},
-                        )
-                    )
-
-            # DB_MISSING_QUERY
-            if value_source == "db":
-                if "query" not in node:
-                    self.issues.append(
-                        LintIssue(
-                            severity=LintSeverity.WARNING,
-                            code="DB_MISSING_QUERY",
-                            message="Database tag is missing 'query' property",
-                            file_path=file_path,
-                            component_path=tag_path,
-                            component_type=tag_type,
-                            suggestion="Add a 'query' property",
-                            metadata={**base_metadata, "search_key": '"valueSource"'},
-                        )
-                    )
+            value_source = node.get("valueSource")
+            check_value_source = (
+                self._VALUE_SOURCE_CHECKS.get(value_source)
+                if isinstance(value_source, str)
+                else None
+            )
+            if check_value_source is not None:
+                check_value_source(self, node, file_path, tag_path, base_metadata)
 
             # HISTORY_NO_PROVIDER
             if node.get("historyEnabled") is True and "historyProvider" not in node:
@@ -468,6 +531,70 @@ class IgnitionTagLinter:
                     )
                 )
 
+    def _check_opc_source(
+        self, node: dict, file_path: str, tag_path: str, base_metadata: dict
+    ) -> None:
+        """OPC_MISSING_CONFIG: an OPC tag needs a server and an item path."""
+        missing_fields = [
+            f"'{field}'" for field in ("opcServer", "opcItemPath") if field not in node
+        ]
+        if missing_fields:
+            self.issues.append(
+                LintIssue(
+                    severity=LintSeverity.WARNING,
+                    code="OPC_MISSING_CONFIG",
+                    message=f"OPC tag is missing {' and '.join(missing_fields)}",
+                    file_path=file_path,
+                    component_path=tag_path,
+                    component_type="AtomicTag",
+                    suggestion="Add 'opcServer' and 'opcItemPath' properties",
+                    metadata={**base_metadata, "search_key": '"valueSource"'},
+                )
+            )
+
+    def _check_expr_source(
+        self, node: dict, file_path: str, tag_path: str, base_metadata: dict
+    ) -> None:
+        """EXPR_MISSING_EXPRESSION: an expression tag needs its expression."""
+        if "expression" not in node:
+            self.issues.append(
+                LintIssue(
+                    severity=LintSeverity.ERROR,
+                    code="EXPR_MISSING_EXPRESSION",
+                    message="Expression tag is missing 'expression' property",
+                    file_path=file_path,
+                    component_path=tag_path,
+                    component_type="AtomicTag",
+                    suggestion="Add an 'expression' property",
+                    metadata={**base_metadata, "search_key": '"valueSource"'},
+                )
+            )
+
+    def _check_db_source(
+        self, node: dict, file_path: str, tag_path: str, base_metadata: dict
+    ) -> None:
+        """DB_MISSING_QUERY: a database tag needs its query."""
+        if "query" not in node:
+            self.issues.append(
+                LintIssue(
+                    severity=LintSeverity.WARNING,
+                    code="DB_MISSING_QUERY",
+                    message="Database tag is missing 'query' property",
+                    file_path=file_path,
+                    component_path=tag_path,
+                    component_type="AtomicTag",
+                    suggestion="Add a 'query' property",
+                    metadata={**base_metadata, "search_key": '"valueSource"'},
+                )
+            )
+
+    # Per-valueSource checks for AtomicTags; sources not listed need none
+    _VALUE_SOURCE_CHECKS: ClassVar[dict[str, Callable[..., None]]] = {
+        "opc": _check_opc_source,
+        "expr": _check_expr_source,
+        "db": _check_db_source,
+    }
+
     # ------------------------------------------------------------------
     # Event script validation
     # ------------------------------------------------------------------
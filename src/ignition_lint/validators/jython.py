@@ -6,6 +6,7 @@ import ast
 import re
 import textwrap
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..reporting import LintIssue, LintSeverity
 
@@ -130,7 +131,46 @@ def _preprocess_py2(source: str) -> str:
     return source
 
 
-@dataclass
+@lru_cache(maxsize=2048)
+def _parse_script(
+    script: str, is_transform: bool, standalone: bool
+) -> ast.Module | SyntaxError:
+    """Prepare an inline script for ``ast.parse`` and parse it.
+
+    Copy-pasted event handlers and transforms are common across a project,
+    so results are cached by script text.  A syntax error is returned
+    rather than raised so it is cached too.  The returned tree is shared
+    between callers and must not be mutated.
+    """
+    # Script transforms are stored with leading tab indentation inside an
+    # implicit function body.  When triple-quoted strings break
+    # textwrap.dedent() common-prefix detection, ast.parse() fails.
+    # Wrap transforms in a def so the indentation is valid Python.
+    if is_transform:
+        # Standalone transforms are already dedented — re-indent so the
+        # body is valid inside the wrapper function.
+        body = textwrap.indent(script, "    ") if standalone else script
+        prepared = f"def _transform(self, value, quality, timestamp):\n{body}"
+        prepared = _preprocess_py2(prepared)
+    elif standalone:
+        # Already dedented — parse directly
+        prepared = _preprocess_py2(script)
+    else:
+        # Ignition stores inline scripts with leading indentation; dedent before parsing
+        prepared = _preprocess_py2(textwrap.dedent(script))
+
+    try:
+        return ast.parse(prepared)
+    except SyntaxError as exc:
+        return exc.with_traceback(None)
+
+
+# How many mixed-indentation / unindented line numbers an issue reports
+_MAX_MIXED_LINES = 3
+_MAX_NON_INDENTED = 5
+
+
+@dataclass(slots=True)
 class JythonIssue:
     """Internal representation used before conversion to lint issue."""
 
@@ -168,20 +208,18 @@ class JythonValidator:
         self._check_ignition_patterns(script_content, context)
         self._check_java_imports(script_content, context)
 
-        lint_issues: list[LintIssue] = []
-        for issue in self.issues:
-            lint_issues.append(
-                LintIssue(
-                    severity=issue.severity,
-                    code=issue.code,
-                    message=issue.message,
-                    file_path="<inline>",
-                    component_path=context,
-                    line_number=issue.line_number,
-                    suggestion=issue.suggestion,
-                )
+        return [
+            LintIssue(
+                severity=issue.severity,
+                code=issue.code,
+                message=issue.message,
+                file_path="<inline>",
+                component_path=context,
+                line_number=issue.line_number,
+                suggestion=issue.suggestion,
             )
-        return lint_issues
+            for issue in self.issues
+        ]
 
     def _check_indentation(
         self, script: str, context: str, standalone: bool = False
@@ -199,44 +237,49 @@ class JythonValidator:
             return
 
         lines = script.split("\n")
-        mixed_lines = []
-        tab_lines = []
-        space_lines = []
-        non_indented = []
+        # Only the first few mixed / unindented lines are reported, so stop
+        # collecting once those lists are full
+        mixed_lines: list[int] = []
+        non_indented: list[int] = []
+        has_tab_lines = False
+        has_space_lines = False
         inconsistent_levels = []
 
         previous_indent = 0
         in_triple_quote = False
+        # Most scripts have no triple-quoted strings; skip the per-line scan then
+        has_triple_quotes = '"""' in script or "'''" in script
 
         for index, line in enumerate(lines, 1):
-            if not line.strip():
+            if not line or line.isspace():
                 continue
 
             # Track triple-quoted string state; skip content lines inside them
-            was_in_triple = in_triple_quote
-            for tq in ('"""', "'''"):
-                count = line.count(tq)
-                if count % 2 == 1:
-                    in_triple_quote = not in_triple_quote
-                    break
-            if was_in_triple:
-                continue
+            if has_triple_quotes:
+                was_in_triple = in_triple_quote
+                for tq in ('"""', "'''"):
+                    count = line.count(tq)
+                    if count % 2 == 1:
+                        in_triple_quote = not in_triple_quote
+                        break
+                if was_in_triple:
+                    continue
 
-            tabs = len(line) - len(line.lstrip("\t"))
+            # Leading whitespace is a run of tabs followed by a run of spaces
             line_after_tabs = line.lstrip("\t")
+            tabs = len(line) - len(line_after_tabs)
             spaces_after_tabs = len(line_after_tabs) - len(line_after_tabs.lstrip(" "))
-            total_spaces = len(line) - len(line.lstrip(" "))
-
-            if not line.startswith("\t") and not line.startswith("    "):
-                non_indented.append(index)
 
-            if "\t" in line[: tabs + spaces_after_tabs]:
-                if spaces_after_tabs > 0:
+            if tabs:
+                if spaces_after_tabs == 0:
+                    has_tab_lines = True
+                elif len(mixed_lines) < _MAX_MIXED_LINES:
                     mixed_lines.append(index)
-                else:
-                    tab_lines.append((index, tabs))
-            elif total_spaces > 0:
-                space_lines.append((index, total_spaces))
+            else:
+                if spaces_after_tabs < 4 and len(non_indented) < _MAX_NON_INDENTED:
+                    non_indented.append(index)
+                if spaces_after_tabs > 0:
+                    has_space_lines = True
 
             current_indent = tabs + (spaces_after_tabs // 4)
             if current_indent > previous_indent + 1:
@@ -249,25 +292,25 @@ class JythonValidator:
                     severity=LintSeverity.ERROR,
                     code="JYTHON_INDENTATION_REQUIRED",
                     message=(
-                        f"Lines {non_indented[:5]} have no indentation - Ignition requires at least one tab or 4 spaces"
+                        f"Lines {non_indented} have no indentation - Ignition requires at least one tab or 4 spaces"
                     ),
                     suggestion="Indent each line with a tab (recommended) or 4 spaces.",
                     line_number=non_indented[0],
                 )
             )
 
-        for line_num in mixed_lines[:3]:
-            self.issues.append(
-                JythonIssue(
-                    severity=LintSeverity.WARNING,
-                    code="JYTHON_MIXED_INDENTATION",
-                    message=f"Mixed tabs and spaces on line {line_num}",
-                    suggestion="Use consistent tabs for indentation (Ignition standard).",
-                    line_number=line_num,
-                )
+        self.issues.extend(
+            JythonIssue(
+                severity=LintSeverity.WARNING,
+                code="JYTHON_MIXED_INDENTATION",
+                message=f"Mixed tabs and spaces on line {line_num}",
+                suggestion="Use consistent tabs for indentation (Ignition standard).",
+                line_number=line_num,
             )
+            for line_num in mixed_lines
+        )
 
-        if space_lines and tab_lines:
+        if has_space_lines and has_tab_lines:
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.INFO,
@@ -277,64 +320,47 @@ class JythonValidator:
                 )
             )
 
-        for line_num, current, previous in inconsistent_levels:
-            self.issues.append(
-                JythonIssue(
-                    severity=LintSeverity.ERROR,
-                    code="JYTHON_INDENTATION_JUMP",
-                    message=f"Indentation jumps from {previous} to {current} levels on line {line_num}.",
-                    suggestion="Increase indentation by one level per logical block.",
-                    line_number=line_num,
-                )
+        self.issues.extend(
+            JythonIssue(
+                severity=LintSeverity.ERROR,
+                code="JYTHON_INDENTATION_JUMP",
+                message=f"Indentation jumps from {previous} to {current} levels on line {line_num}.",
+                suggestion="Increase indentation by one level per logical block.",
+                line_number=line_num,
             )
+            for line_num, current, previous in inconsistent_levels
+        )
 
     def _check_syntax(
         self, script: str, context: str, standalone: bool = False
     ) -> ast.Module | None:
-        # Script transforms are stored with leading tab indentation inside an
-        # implicit function body.  When triple-quoted strings break
-        # textwrap.dedent() common-prefix detection, ast.parse() fails.
-        # Wrap transforms in a def so the indentation is valid Python.
         is_transform = "transform[" in context
-        if is_transform:
-            # Standalone transforms are already dedented — re-indent so the
-            # body is valid inside the wrapper function.
-            body = textwrap.indent(script, "    ") if standalone else script
-            prepared = f"def _transform(self, value, quality, timestamp):\n{body}"
-            prepared = _preprocess_py2(prepared)
-        elif standalone:
-            # Already dedented — parse directly
-            prepared = _preprocess_py2(script)
-        else:
-            # Ignition stores inline scripts with leading indentation; dedent before parsing
-            prepared = _preprocess_py2(textwrap.dedent(script))
-
         line_offset = -1 if is_transform else 0
         try:
-            tree = ast.parse(prepared)
-        except SyntaxError as exc:
-            reported_line = max(1, (exc.lineno or 1) + line_offset)
+            result = _parse_script(script, is_transform, standalone)
+        except Exception as exc:
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.ERROR,
-                    code="JYTHON_SYNTAX_ERROR",
-                    message=f"Python syntax error: {exc.msg}",
-                    suggestion=f"Fix syntax near line {reported_line}.",
-                    line_number=reported_line,
+                    code="JYTHON_PARSE_ERROR",
+                    message=f"Could not parse script: {exc}",
+                    suggestion="Check script for syntax issues.",
                 )
             )
             return None
-        except Exception as exc:
+        if isinstance(result, SyntaxError):
+            reported_line = max(1, (result.lineno or 1) + line_offset)
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.ERROR,
-                    code="JYTHON_PARSE_ERROR",
-                    message=f"Could not parse script: {exc}",
-                    suggestion="Check script for syntax issues.",
+                    code="JYTHON_SYNTAX_ERROR",
+                    message=f"Python syntax error: {result.msg}",
+                    suggestion=f"Fix syntax near line {reported_line}.",
+                    line_number=reported_line,
                 )
             )
             return None
-        return tree
+        return result
 
     def _check_duplicate_definitions(self, tree: ast.Module, context: str) -> None:
         """Flag functions or classes defined more than once at the same scope."""
@@ -397,6 +423,16 @@ class JythonValidator:
 
         _check_scope(tree.body, "")
 
+    # -- Ignition pattern checks ---------------------------------------------
+
+    _PRINT_STATEMENT_RE = re.compile(r"\bprint\s+[^(]")
+    _BARE_PRINT_CALL_RE = re.compile(r"(?<![.\w])print\s*\(")
+    _COMPONENT_TRAVERSAL_FUNCS = ("getSibling", "getParent", "getChild", "getComponent")
+    # One alternation finds every traversal call in a single pass over the script
+    _COMPONENT_TRAVERSAL_RE = re.compile(
+        rf"\b({'|'.join(_COMPONENT_TRAVERSAL_FUNCS)})\s*\("
+    )
+
     def _check_ignition_patterns(self, script: str, context: str) -> None:
         if "localhost" in script or "127.0.0.1" in script:
             self.issues.append(
@@ -408,8 +444,11 @@ class JythonValidator:
                 )
             )
 
+        # Both print checks need the literal; most scripts never print
+        has_print = "print" in script
+
         # Flag print statement syntax (print x) — should use print() function
-        if re.search(r"\bprint\s+[^(]", script):
+        if has_print and self._PRINT_STATEMENT_RE.search(script):
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.WARNING,
@@ -420,7 +459,7 @@ class JythonValidator:
             )
 
         # Suggest system.perspective.print() over bare print() in Perspective scripts
-        if re.search(r"(?<![.\w])print\s*\(", script):
+        if has_print and self._BARE_PRINT_CALL_RE.search(script):
             self.issues.append(
                 JythonIssue(
                     severity=LintSeverity.INFO,
@@ -430,8 +469,11 @@ class JythonValidator:
                 )
             )
 
+        # Scanned once for both error-handling checks below
+        has_try = "try:" in script
+
         if ("httpClient" in script or "httpPost" in script or "httpGet" in script) and (
-            "try:" not in script or "except" not in script
+            not has_try or "except" not in script
         ):
             self.issues.append(
                 JythonIssue(
@@ -442,19 +484,26 @@ class JythonValidator:
                 )
             )
 
-        for func in ["getChild", "getSibling", "sendMessage", "closePopup"]:
-            if func in script and "try:" not in script:
-                self.issues.append(
-                    JythonIssue(
-                        severity=LintSeverity.INFO,
-                        code="JYTHON_RECOMMEND_ERROR_HANDLING",
-                        message=f"Consider wrapping {func} usage in error handling.",
+        if not has_try:
+            for func in ("getChild", "getSibling", "sendMessage", "closePopup"):
+                if func in script:
+                    self.issues.append(
+                        JythonIssue(
+                            severity=LintSeverity.INFO,
+                            code="JYTHON_RECOMMEND_ERROR_HANDLING",
+                            message=f"Consider wrapping {func} usage in error handling.",
+                        )
                     )
-                )
 
         # Flag fragile component tree traversal
-        for func in ["getSibling", "getParent", "getChild", "getComponent"]:
-            if re.search(rf"\b{func}\s*\(", script):
+        # Every traversal function starts with "get"; skip the regex without one
+        called = (
+            {m.group(1) for m in self._COMPONENT_TRAVERSAL_RE.finditer(script)}
+            if "get" in script
+            else set()
+        )
+        for func in self._COMPONENT_TRAVERSAL_FUNCS:
+            if func in called:
                 self.issues.append(
                     JythonIssue(
                         severity=LintSeverity.WARNING,
@@ -473,9 +522,12 @@ class JythonValidator:
         """Flag invalid or suspicious Java import patterns."""
         dedented = textwrap.dedent(script)
         imported_names: list[tuple[str, int]] = []  # (name, line_number)
+        body_lines: list[str] = []  # everything that isn't an import line
 
         for line_num, line in enumerate(dedented.splitlines(), 1):
             stripped = line.strip()
+            if not stripped.startswith(("from ", "import ")):
+                body_lines.append(line)
 
             # Skip comments
             if stripped.startswith("#"):
@@ -540,13 +592,6 @@ class JythonValidator:
 
         # Check for unused Java imports
         if imported_names:
-            # Build the body text (everything that isn't an import line)
-            body_lines = []
-            for line in dedented.splitlines():
-                stripped = line.strip()
-                if stripped.startswith("from ") or stripped.startswith("import "):
-                    continue
-                body_lines.append(line)
             body = "\n".join(body_lines)
 
             for name, line_num in imported_names:
@@ -0,0 +1,18 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from ignition_lint.tags import IgnitionTagLinter
+
+
+@pytest.fixture(scope="session")
+def _session_tag_linter():
+    # One per process, i.e. one per worker under pytest-xdist
+    return IgnitionTagLinter()
+
+
+@pytest.fixture
+def tag_linter(_session_tag_linter):
+    """Tag linter shared across the session, with issues cleared for each test."""
+    _session_tag_linter.reset()
+    return _session_tag_linter
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from ignition_lint import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+def test_loads_accepts_str_and_bytes(json_backend):
+    assert _json.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert _json.loads(b'{"id": 1, "method": "lint"}') == {"id": 1, "method": "lint"}
+
+
+def test_loads_reports_stdlib_error(json_backend):
+    with pytest.raises(json.JSONDecodeError) as excinfo:
+        _json.loads("{bad}")
+    assert str(excinfo.value) == (
+        "Expecting property name enclosed in double quotes: line 1 column 2 (char 1)"
+    )
+
+
+def test_dumps_round_trips(json_backend):
+    message = {"id": 1, "result": {"diagnostics": [], "name": "Läbel"}}
+    payload = _json.dumps(message)
+    assert isinstance(payload, bytes)
+    assert _json.loads(payload) == message
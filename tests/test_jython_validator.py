@@ -27,6 +27,29 @@ def test_detects_best_practices():
     assert "JYTHON_HTTP_WITHOUT_EXCEPTION_HANDLING" in codes
 
 
+def test_recommend_error_handling_only_without_try():
+    script = "\tsystem.perspective.sendMessage('refresh')"
+    codes = {issue.code for issue in validate(script)}
+    assert "JYTHON_RECOMMEND_ERROR_HANDLING" in codes
+
+    wrapped = f"\ttry:\n\t{script}\n\texcept Exception:\n\t\tpass"
+    codes = {issue.code for issue in validate(wrapped)}
+    assert "JYTHON_RECOMMEND_ERROR_HANDLING" not in codes
+
+
+def test_component_traversal_reported_in_fixed_order():
+    issues = validate(
+        "\ttry:\n"
+        "\t\tlabel = self.getChild('Label')\n"
+        "\t\tother = self.getSibling ('Other')\n"
+        "\t\tkids = self.getChildren()\n"
+        "\texcept Exception:\n"
+        "\t\tpass"
+    )
+    refs = [i.message for i in issues if i.code == "JYTHON_BAD_COMPONENT_REF"]
+    assert [m.split("'")[1] for m in refs] == ["getSibling()", "getChild()"]
+
+
 def test_clean_script_produces_no_issues():
     script = "\ttry:\n\t\treturn system.date.now()\n\texcept Exception as err:\n\t\tsystem.perspective.print(str(err))"
     assert validate(script) == []
@@ -293,3 +316,24 @@ class TestDuplicateDefinitions:
         dupes = [i for i in issues if i.code == "JYTHON_DUPLICATE_DEFINITION"]
         assert len(dupes) == 1
         assert "silently overwrites" in dupes[0].suggestion
+
+
+class TestParseCache:
+    """Parse results are cached by script text; issues must not leak between contexts."""
+
+    def test_cache_keyed_on_transform_wrapping(self):
+        # Dedent cannot strip the tab past the triple-quoted lines
+        script = '\tquery = """\nusers\n"""\n\treturn query'
+        for _ in range(2):
+            plain = {i.code for i in validate(script)}
+            transform = {i.code for i in validate_with_context(script, "transform[0]")}
+            assert "JYTHON_SYNTAX_ERROR" in plain
+            assert "JYTHON_SYNTAX_ERROR" not in transform
+
+    def test_repeated_syntax_error_reports_same_line(self):
+        script = "\tx = 1\n\tif value >\n\t\tpass"
+        lines = [
+            [i.line_number for i in validate(script) if i.code == "JYTHON_SYNTAX_ERROR"]
+            for _ in range(2)
+        ]
+        assert lines == [[2], [2]]
@@ -0,0 +1,103 @@
+"""Tests for the tools/jython_whitespace_validator.py batch helpers."""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+import jython_whitespace_validator as tool  # noqa: E402
+
+_GOOD = "\tx = 1\n"
+_BAD = "x = 1\n  y = 2\n"
+
+
+def _pairs(count):
+    """Alternate clean and broken scripts so results can be told apart."""
+    return [(f"script[{i}]", _BAD if i % 3 == 0 else _GOOD) for i in range(count)]
+
+
+def _assert_in_input_order(pairs, results):
+    for (context, script), issues in zip(pairs, results, strict=True):
+        if script == _GOOD:
+            assert issues == []
+        else:
+            assert issues
+            assert {issue.component_path for issue in issues} == {context}
+
+
+def _no_pool(*args, **kwargs):
+    raise AssertionError("worker processes must be opt-in")
+
+
+def _recording_pool(started):
+    def make_pool(*args, **kwargs):
+        started.append(kwargs)
+        return ProcessPoolExecutor(*args, **kwargs)
+
+    return make_pool
+
+
+class TestValidateMany:
+    def test_runs_inline_by_default(self, monkeypatch):
+        monkeypatch.setattr(tool, "ProcessPoolExecutor", _no_pool)
+        pairs = _pairs(200)
+        _assert_in_input_order(pairs, tool.validate_many(pairs))
+
+    def test_max_workers_uses_pool(self, monkeypatch):
+        started = []
+        monkeypatch.setattr(tool, "ProcessPoolExecutor", _recording_pool(started))
+        pairs = _pairs(20)
+        results = tool.validate_many(iter(pairs), max_workers=2)
+        assert started == [{"max_workers": 2}]
+        _assert_in_input_order(pairs, results)
+
+    def test_concurrent_callers_do_not_share_state(self):
+        batches = [_pairs(30)[offset:] for offset in range(8)]
+        expected = [tool.validate_many(pairs) for pairs in batches]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert list(pool.map(tool.validate_many, batches)) == expected
+
+    def test_pool_matches_inline(self):
+        pairs = _pairs(20)
+        assert tool.validate_many(pairs, max_workers=2) == tool.validate_many(pairs)
+
+
+class TestBatchEntryPoints:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_events_metadata_matches_handler(self, monkeypatch, workers):
+        started = []
+        monkeypatch.setattr(tool, "ProcessPoolExecutor", _recording_pool(started))
+        handlers = [
+            {"type": "script", "config": {"script": script}} for _, script in _pairs(12)
+        ]
+        events = {"dom": {"onClick": handlers, "onHover": handlers[0]}}
+
+        issues = tool.validate_jython_in_events(events, max_workers=workers)
+        assert len(started) == (workers > 1)
+        broken = {
+            (i.metadata["eventName"], i.metadata["handlerIndex"], i.component_path)
+            for i in issues
+        }
+        expected = {
+            ("onClick", str(idx), f"events.dom.onClick[{idx}]")
+            for idx in range(0, 12, 3)
+        }
+        expected.add(("onHover", "0", "events.dom.onHover[0]"))
+        assert broken == expected
+
+    def test_binding_transform_index(self, monkeypatch):
+        monkeypatch.setattr(tool, "ProcessPoolExecutor", _no_pool)
+        binding = {
+            "transforms": [
+                {"type": "script", "code": _GOOD},
+                {"type": "map"},
+                {"type": "script", "code": _BAD},
+            ]
+        }
+        issues = tool.validate_jython_in_binding(binding)
+        assert issues
+        assert {i.metadata["transformIndex"] for i in issues} == {"2"}
+        assert {i.component_path for i in issues} == {"transform[2]"}
@@ -0,0 +1,104 @@
+"""Tests for the tools/ignition-lsp-server.py message framing."""
+
+import importlib.util
+import io
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+_SERVER_PATH = Path(__file__).resolve().parents[1] / "tools" / "ignition-lsp-server.py"
+
+
+@pytest.fixture(scope="module")
+def server():
+    spec = importlib.util.spec_from_file_location("ignition_lsp_server", _SERVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _framed(body: bytes, *extra_headers: bytes) -> bytes:
+    headers = [b"Content-Length: %d" % len(body), *extra_headers]
+    return b"\r\n".join(headers) + b"\r\n\r\n" + body
+
+
+def _read_all(server, data: bytes):
+    return list(server._read_messages(io.BytesIO(data)))
+
+
+_REQUEST = b'{"id": 1, "method": "lint"}'
+
+
+class TestReadMessages:
+    def test_single_framed_message(self, server):
+        assert _read_all(server, _framed(_REQUEST)) == [(_REQUEST, True)]
+
+    def test_extra_content_type_header(self, server):
+        content_type = b"Content-Type: application/vscode-jsonrpc; charset=utf-8"
+        after = _framed(_REQUEST, content_type)
+        before = content_type + b"\r\n" + _framed(_REQUEST)
+        assert _read_all(server, after) == [(_REQUEST, True)]
+        assert _read_all(server, before) == [(_REQUEST, True)]
+
+    def test_framed_and_line_delimited_mixed(self, server):
+        second = b'{"id": 2}'
+        data = _framed(_REQUEST) + second + b"\n" + _framed(b'{"id": 3}')
+        assert _read_all(server, data) == [
+            (_REQUEST, True),
+            (second + b"\n", False),
+            (b'{"id": 3}', True),
+        ]
+
+    def test_blank_lines_between_messages(self, server):
+        data = b"\n" + _framed(_REQUEST) + b"\r\n\n" + b'{"id": 2}\n' + b"\n"
+        assert _read_all(server, data) == [(_REQUEST, True), (b'{"id": 2}\n', False)]
+
+    def test_eof_after_headers(self, server):
+        data = _framed(_REQUEST)[: -len(_REQUEST)]
+        assert _read_all(server, data) == []
+        assert _read_all(server, b"Content-Length: 5\r\n") == []
+
+    def test_eof_partway_through_body(self, server):
+        data = _framed(b'{"id": 2}') + _framed(_REQUEST)[:-3]
+        assert _read_all(server, data) == [(b'{"id": 2}', True)]
+
+
+class TestMain:
+    def _run(self, server, monkeypatch, data: bytes) -> bytes:
+        stdout = SimpleNamespace(buffer=io.BytesIO())
+        monkeypatch.setattr(sys, "stdin", SimpleNamespace(buffer=io.BytesIO(data)))
+        monkeypatch.setattr(sys, "stdout", stdout)
+        server.main()
+        return stdout.buffer.getvalue()
+
+    def _lint_request(self, request_id: int) -> bytes:
+        request = {
+            "id": request_id,
+            "method": "lint",
+            "params": {"uri": "view.json", "text": "{}"},
+        }
+        return json.dumps(request).encode("utf-8")
+
+    def test_reply_matches_request_framing(self, server, monkeypatch):
+        data = _framed(self._lint_request(1)) + self._lint_request(2) + b"\n"
+        out = io.BytesIO(self._run(server, monkeypatch, data))
+
+        header = out.readline()
+        assert header.startswith(b"Content-Length: ")
+        assert out.readline() == b"\r\n"
+        framed = out.read(int(header.split(b":")[1]))
+        assert json.loads(framed)["id"] == 1
+
+        line = out.readline()
+        assert line.endswith(b"\n")
+        assert json.loads(line)["id"] == 2
+        assert out.read() == b""
+
+    def test_bad_request_gets_error_reply(self, server, monkeypatch):
+        out = self._run(server, monkeypatch, b"{not json}\n")
+        reply = json.loads(out)
+        assert reply["id"] is None
+        assert reply["error"]["code"] == -1
@@ -1,50 +1,31 @@
 """Test that malformed tag nodes are properly rejected."""
 
-import json
-import os
-import tempfile
 
-from ignition_lint.tags.linter import IgnitionTagLinter
-
-
-def test_malformed_tag_node_rejected():
+def test_malformed_tag_node_rejected(tag_linter):
     """Non-dict tag nodes should be rejected with an error."""
-    linter = IgnitionTagLinter()
-
-    # Create a test file with a malformed tag (string instead of dict)
+    # A malformed tag document (string instead of dict)
     malformed_data = "not a dict"
+    assert tag_linter.codes == frozenset(), "Fixture should start with no issues"
 
-    tmpdir = tempfile.mkdtemp()
-    path = os.path.join(tmpdir, "malformed.json")
-
-    try:
-        with open(path, "w") as f:
-            json.dump(malformed_data, f)
-
-        result = linter.lint_file(path)
+    result = tag_linter.lint_data(malformed_data)
 
-        # Should return False (invalid)
-        assert result is False, "Malformed tag should fail validation"
+    # Should return False (invalid)
+    assert result is False, "Malformed tag should fail validation"
 
-        # Should have an INVALID_TAG_NODE error
-        codes = {issue.code for issue in linter.issues}
-        assert "INVALID_TAG_NODE" in codes, "Should report INVALID_TAG_NODE error"
+    # Should have an INVALID_TAG_NODE error
+    assert (
+        "INVALID_TAG_NODE" in tag_linter.codes
+    ), "Should report INVALID_TAG_NODE error"
 
-        # Check error message
-        invalid_issues = [i for i in linter.issues if i.code == "INVALID_TAG_NODE"]
-        assert len(invalid_issues) == 1
-        assert "str" in invalid_issues[0].message
-        assert "not a dict" in invalid_issues[0].message
+    # Check error message
+    invalid_issues = tag_linter.issues_by_code.get("INVALID_TAG_NODE", [])
+    assert len(invalid_issues) == 1
+    assert "str" in invalid_issues[0].message
+    assert "not a dict" in invalid_issues[0].message
 
-    finally:
-        os.unlink(path)
-        os.rmdir(tmpdir)
 
-
-def test_malformed_child_tag_rejected():
+def test_malformed_child_tag_rejected(tag_linter):
     """Non-dict child tags should be rejected with an error."""
-    linter = IgnitionTagLinter()
-
     # Parent tag is valid, but child is malformed
     data = {
         "name": "ParentFolder",
@@ -61,36 +42,30 @@ def test_malformed_child_tag_rejected():
         ],
     }
 
-    tmpdir = tempfile.mkdtemp()
-    path = os.path.join(tmpdir, "parent.json")
-
-    try:
-        with open(path, "w") as f:
-            json.dump(data, f)
+    result = tag_linter.lint_data(data)
 
-        result = linter.lint_file(path)
+    # Should return False (invalid due to malformed children)
+    assert result is False, "Should fail validation due to malformed children"
 
-        # Should return False (invalid due to malformed children)
-        assert result is False, "Should fail validation due to malformed children"
+    # Should have INVALID_TAG_NODE errors for the two malformed children
+    assert "INVALID_TAG_NODE" in tag_linter.codes
+    invalid_issues = tag_linter.issues_by_code.get("INVALID_TAG_NODE", [])
+    assert len(invalid_issues) == 2, f"Expected 2 errors, got {len(invalid_issues)}"
 
-        # Should have INVALID_TAG_NODE errors for the two malformed children
-        invalid_issues = [i for i in linter.issues if i.code == "INVALID_TAG_NODE"]
-        assert len(invalid_issues) == 2, f"Expected 2 errors, got {len(invalid_issues)}"
+    # Check that both malformed children are reported
+    messages = [i.message for i in invalid_issues]
+    assert any("str" in msg for msg in messages), "Should report string child"
+    assert any("int" in msg for msg in messages), "Should report int child"
 
-        # Check that both malformed children are reported
-        messages = [i.message for i in invalid_issues]
-        assert any("str" in msg for msg in messages), "Should report string child"
-        assert any("int" in msg for msg in messages), "Should report int child"
-
-    finally:
-        os.unlink(path)
-        os.rmdir(tmpdir)
+    # Paths still point at the original list positions
+    assert [i.component_path for i in invalid_issues] == [
+        "ParentFolder/tags[1]",
+        "ParentFolder/tags[2]",
+    ]
 
 
-def test_array_with_malformed_entry():
+def test_array_with_malformed_entry(tag_linter):
     """Top-level arrays with malformed entries should be rejected."""
-    linter = IgnitionTagLinter()
-
     # Array with one valid and one malformed entry
     data = [
         {
@@ -102,36 +77,13 @@ def test_array_with_malformed_entry():
         ["nested", "array"],  # This should be rejected
     ]
 
-    tmpdir = tempfile.mkdtemp()
-    path = os.path.join(tmpdir, "array.json")
-
-    try:
-        with open(path, "w") as f:
-            json.dump(data, f)
-
-        result = linter.lint_file(path)
-
-        # Should return False due to malformed entry
-        assert result is False, "Should fail validation due to malformed array entry"
-
-        # Should have INVALID_TAG_NODE error
-        invalid_issues = [i for i in linter.issues if i.code == "INVALID_TAG_NODE"]
-        assert len(invalid_issues) == 1
-        assert "list" in invalid_issues[0].message
-
-    finally:
-        os.unlink(path)
-        os.rmdir(tmpdir)
-
-
-if __name__ == "__main__":
-    test_malformed_tag_node_rejected()
-    print("✓ test_malformed_tag_node_rejected passed")
-
-    test_malformed_child_tag_rejected()
-    print("✓ test_malformed_child_tag_rejected passed")
+    result = tag_linter.lint_data(data)
 
-    test_array_with_malformed_entry()
-    print("✓ test_array_with_malformed_entry passed")
+    # Should return False due to malformed entry
+    assert result is False, "Should fail validation due to malformed array entry"
 
-    print("\nAll tests passed!")
+    # Should have INVALID_TAG_NODE error
+    assert "INVALID_TAG_NODE" in tag_linter.codes
+    invalid_issues = tag_linter.issues_by_code.get("INVALID_TAG_NODE", [])
+    assert len(invalid_issues) == 1
+    assert "list" in invalid_issues[0].message
@@ -1,68 +1,63 @@
 """Tests for Perspective linter enhancements (onChange, unused props, expressions)."""
 
 import json
-import os
-import tempfile
+
+import pytest
 
 from ignition_lint.perspective.linter import IgnitionPerspectiveLinter
+from ignition_lint.reporting import LintSeverity
 
 
 def _lint_view(view_data):
-    """Helper: write view_data to a temp dir/view.json and lint it."""
+    """Helper: lint view_data in memory."""
     linter = IgnitionPerspectiveLinter()
-    tmpdir = tempfile.mkdtemp()
-    path = os.path.join(tmpdir, "view.json")
-    with open(path, "w") as f:
-        json.dump(view_data, f)
+    linter.lint_data(view_data)
+    return linter
 
-    try:
-        linter.lint_file(path)
-    finally:
-        os.unlink(path)
-        os.rmdir(tmpdir)
 
-    return linter.issues
+def _flex_root(**overrides):
+    """Helper: a flex container named ``Root`` with no children."""
+    root = {"type": "ia.container.flex", "meta": {"name": "Root"}, "children": []}
+    root.update(overrides)
+    return root
 
 
-def _codes(issues):
-    return {i.code for i in issues}
+def _label(**overrides):
+    """Helper: a label component named ``Label`` with no children."""
+    label = {"type": "ia.display.label", "meta": {"name": "Label"}, "children": []}
+    label.update(overrides)
+    return label
 
 
 class TestOnChangeValidation:
     def test_valid_onchange_script(self):
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [],
-                "propConfig": {
+            "root": _flex_root(
+                propConfig={
                     "props.text": {
                         "onChange": {
                             "script": "\tvalue = self.props.text\n\tsystem.perspective.print(str(value))"
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
+        linter = _lint_view(view)
         # No syntax errors expected
-        assert "JYTHON_SYNTAX_ERROR" not in _codes(issues)
+        assert "JYTHON_SYNTAX_ERROR" not in linter.codes
 
     def test_onchange_syntax_error(self):
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [],
-                "propConfig": {
+            "root": _flex_root(
+                propConfig={
                     "props.text": {"onChange": {"script": "\tif value >\n\t\tpass"}}
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "JYTHON_SYNTAX_ERROR" in _codes(issues)
+        linter = _lint_view(view)
+        assert "JYTHON_SYNTAX_ERROR" in linter.codes
 
     def test_view_level_onchange(self):
         view = {
@@ -70,14 +65,10 @@ class TestOnChangeValidation:
             "propConfig": {
                 "custom.myProp": {"onChange": {"script": "\tif value >\n\t\tpass"}}
             },
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [],
-            },
+            "root": _flex_root(),
         }
-        issues = _lint_view(view)
-        assert "JYTHON_SYNTAX_ERROR" in _codes(issues)
+        linter = _lint_view(view)
+        assert "JYTHON_SYNTAX_ERROR" in linter.codes
 
 
 class TestUnusedProperties:
@@ -85,23 +76,17 @@ class TestUnusedProperties:
         view = {
             "custom": {"unusedProp": ""},
             "params": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [],
-            },
+            "root": _flex_root(),
         }
-        issues = _lint_view(view)
-        assert "UNUSED_CUSTOM_PROPERTY" in _codes(issues)
+        linter = _lint_view(view)
+        assert "UNUSED_CUSTOM_PROPERTY" in linter.codes
 
     def test_used_in_expression_passes(self):
         view = {
             "custom": {"myProp": ""},
             "params": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.display.label",
                         "meta": {"name": "MyLabel"},
@@ -115,11 +100,11 @@ class TestUnusedProperties:
                             }
                         },
                     }
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        assert "UNUSED_CUSTOM_PROPERTY" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "UNUSED_CUSTOM_PROPERTY" not in linter.codes
 
     def test_used_in_propconfig_key_passes(self):
         view = {
@@ -133,135 +118,86 @@ class TestUnusedProperties:
                     }
                 }
             },
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [],
-            },
+            "root": _flex_root(),
         }
-        issues = _lint_view(view)
-        assert "UNUSED_CUSTOM_PROPERTY" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "UNUSED_CUSTOM_PROPERTY" not in linter.codes
 
     def test_unused_param_info(self):
         view = {
             "custom": {},
             "params": {"unusedParam": "default"},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [],
-            },
+            "root": _flex_root(),
         }
-        issues = _lint_view(view)
-        assert "UNUSED_PARAM_PROPERTY" in _codes(issues)
-        param_issues = [i for i in issues if i.code == "UNUSED_PARAM_PROPERTY"]
-        from ignition_lint.reporting import LintSeverity
-
+        linter = _lint_view(view)
+        assert "UNUSED_PARAM_PROPERTY" in linter.codes
+        param_issues = linter.issues_by_code.get("UNUSED_PARAM_PROPERTY", [])
         assert all(i.severity == LintSeverity.INFO for i in param_issues)
 
 
 class TestUnknownPropValidation:
-    def test_unknown_prop_flagged(self):
-        view = {
-            "custom": {},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "MyLabel"},
-                "props": {"text": "Hello", "random": True},
-                "children": [],
-            },
-        }
-        issues = _lint_view(view)
-        unknown = [i for i in issues if i.code == "UNKNOWN_PROP"]
-        assert len(unknown) == 1
-        assert "random" in unknown[0].message
-
-    def test_known_props_not_flagged(self):
-        view = {
-            "custom": {},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "MyLabel"},
-                "props": {"text": "Hello", "style": {"color": "red"}, "visible": True},
-                "children": [],
-            },
-        }
-        issues = _lint_view(view)
-        assert "UNKNOWN_PROP" not in _codes(issues)
-
-    def test_unknown_prop_severity_is_style(self):
-        view = {
-            "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "props": {"bogus": 42},
-                "children": [],
-            },
-        }
-        issues = _lint_view(view)
-        unknown = [i for i in issues if i.code == "UNKNOWN_PROP"]
-        from ignition_lint.reporting import LintSeverity
-
-        assert all(i.severity == LintSeverity.STYLE for i in unknown)
-
-    def test_multiple_unknown_props(self):
-        view = {
-            "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "props": {"foo": 1, "xyzzy": 2, "direction": "row"},
-                "children": [],
-            },
-        }
-        issues = _lint_view(view)
-        unknown = [i for i in issues if i.code == "UNKNOWN_PROP"]
-        assert len(unknown) == 2
-        flagged_names = {i.message.split("'")[1] for i in unknown}
-        assert flagged_names == {"foo", "xyzzy"}
-
-    def test_empty_props_safe(self):
-        view = {
-            "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "props": {},
-                "children": [],
-            },
-        }
-        issues = _lint_view(view)
-        assert "UNKNOWN_PROP" not in _codes(issues)
+    _NAMES = {
+        "ia.display.label": "MyLabel",
+        "ia.display.image": "MyImage",
+        "ia.container.flex": "Root",
+    }
 
-    def test_no_props_key_safe(self):
-        view = {
-            "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [],
-            },
+    @classmethod
+    def _make_view(cls, component_type, props=None):
+        """Build a single-component view; ``props=None`` omits the key."""
+        root = {
+            "type": component_type,
+            "meta": {"name": cls._NAMES[component_type]},
+            "children": [],
         }
-        issues = _lint_view(view)
-        assert "UNKNOWN_PROP" not in _codes(issues)
-
-    def test_image_fit_prop_not_flagged(self):
-        """Regression: 'fit' is a valid prop for ia.display.image."""
-        view = {
-            "custom": {},
-            "root": {
-                "type": "ia.display.image",
-                "meta": {"name": "MyImage"},
-                "props": {
+        if props is not None:
+            root["props"] = props
+        return {"custom": {}, "root": root}
+
+    @pytest.mark.parametrize(
+        ("component_type", "props", "expected_unknown"),
+        [
+            ("ia.display.label", {"text": "Hello", "random": True}, {"random"}),
+            (
+                "ia.display.label",
+                {"text": "Hello", "style": {"color": "red"}, "visible": True},
+                set(),
+            ),
+            ("ia.container.flex", {"bogus": 42}, {"bogus"}),
+            (
+                "ia.container.flex",
+                {"foo": 1, "xyzzy": 2, "direction": "row"},
+                {"foo", "xyzzy"},
+            ),
+            ("ia.container.flex", {}, set()),
+            ("ia.container.flex", None, set()),
+            # Regression: 'fit' is a valid prop for ia.display.image.
+            (
+                "ia.display.image",
+                {
                     "source": "/images/logo.png",
                     "fit": {"mode": "contain"},
                     "alt": "Logo",
                 },
-            },
-        }
-        issues = _lint_view(view)
-        assert "UNKNOWN_PROP" not in _codes(issues)
+                set(),
+            ),
+        ],
+        ids=[
+            "unknown-flagged",
+            "known-not-flagged",
+            "single-unknown",
+            "multiple-unknown",
+            "empty-props",
+            "no-props-key",
+            "image-fit",
+        ],
+    )
+    def test_unknown_props(self, component_type, props, expected_unknown):
+        linter = _lint_view(self._make_view(component_type, props))
+        unknown = linter.issues_by_code.get("UNKNOWN_PROP", [])
+        assert {i.message.split("'")[1] for i in unknown} == expected_unknown
+        assert len(unknown) == len(expected_unknown)
+        assert all(i.severity == LintSeverity.STYLE for i in unknown)
 
     def test_known_props_from_schema(self):
         """Known prop names are derived from the component schema, not hardcoded."""
@@ -273,6 +209,24 @@ class TestUnknownPropValidation:
         assert "style" in linter.known_prop_names
         assert "text" in linter.known_prop_names
 
+    def test_known_props_shared_between_linters(self):
+        """Schema-derived prop names are computed once per schema file."""
+        first = IgnitionPerspectiveLinter()
+        second = IgnitionPerspectiveLinter()
+        assert isinstance(first.known_prop_names, frozenset)
+        assert first.known_prop_names is second.known_prop_names
+
+    def test_schema_validator_shared_between_linters(self):
+        first = IgnitionPerspectiveLinter()
+        first.warmup()
+        second = IgnitionPerspectiveLinter()
+        assert first._schema_validator is second._schema_validator
+
+        second.lint_data({"custom": {}, "root": _flex_root(position="x")})
+        issue = second.issues_by_code["SCHEMA_VALIDATION"][0]
+        assert issue.message == "Schema validation failed: 'x' is not of type 'object'"
+        assert issue.suggestion == "Path: position"
+
 
 class TestPerComponentUnknownProp:
     """Per-component property map reduces UNKNOWN_PROP false positives."""
@@ -294,8 +248,8 @@ class TestPerComponentUnknownProp:
                 "children": [],
             },
         }
-        issues = _lint_view(view)
-        assert "UNKNOWN_PROP" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "UNKNOWN_PROP" not in linter.codes
 
     def test_genuinely_unknown_prop_still_flagged(self):
         """A truly unknown prop should still be flagged even on a known component."""
@@ -308,8 +262,8 @@ class TestPerComponentUnknownProp:
                 "children": [],
             },
         }
-        issues = _lint_view(view)
-        unknown = [i for i in issues if i.code == "UNKNOWN_PROP"]
+        linter = _lint_view(view)
+        unknown = linter.issues_by_code.get("UNKNOWN_PROP", [])
         assert len(unknown) == 1
         assert "zzNonexistent" in unknown[0].message
 
@@ -329,8 +283,8 @@ class TestPerComponentUnknownProp:
                 "children": [],
             },
         }
-        issues = _lint_view(view)
-        assert "UNKNOWN_PROP" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "UNKNOWN_PROP" not in linter.codes
 
     def test_unknown_component_type_falls_back_to_generic(self):
         """Unknown component types still use generic schema props."""
@@ -343,8 +297,8 @@ class TestPerComponentUnknownProp:
                 "children": [],
             },
         }
-        issues = _lint_view(view)
-        assert "UNKNOWN_PROP" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "UNKNOWN_PROP" not in linter.codes
 
 
 class TestExpressionValidation:
@@ -365,8 +319,8 @@ class TestExpressionValidation:
                 },
             },
         }
-        issues = _lint_view(view)
-        assert "EXPR_NOW_DEFAULT_POLLING" in _codes(issues)
+        linter = _lint_view(view)
+        assert "EXPR_NOW_DEFAULT_POLLING" in linter.codes
 
     def test_expression_transform_validated(self):
         view = {
@@ -391,8 +345,8 @@ class TestExpressionValidation:
                 },
             },
         }
-        issues = _lint_view(view)
-        assert "EXPR_BAD_COMPONENT_REF" in _codes(issues)
+        linter = _lint_view(view)
+        assert "EXPR_BAD_COMPONENT_REF" in linter.codes
 
 
 class TestPropertyBindingPathValidation:
@@ -414,11 +368,11 @@ class TestPropertyBindingPathValidation:
                 },
             },
         }
-        issues = _lint_view(view)
-        codes = _codes(issues)
+        linter = _lint_view(view)
+        codes = linter.codes
         assert "BINDING_ROOT_DOT_PATH" in codes
         # Check the suggestion is explicit about the fix
-        issue = next(i for i in issues if i.code == "BINDING_ROOT_DOT_PATH")
+        issue = linter.issues_by_code["BINDING_ROOT_DOT_PATH"][0]
         assert "view.custom.auditData" in issue.suggestion
         assert '"path": "view.custom.auditData"' in issue.suggestion
 
@@ -427,31 +381,26 @@ class TestPropertyBindingPathValidation:
         view = {
             "custom": {},
             "params": {"item": {}},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "property",
                             "config": {"path": "/root.params.item"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_ROOT_DOT_PATH" in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_ROOT_DOT_PATH" in linter.codes
 
     def test_root_slash_component_ref_not_flagged(self):
         """Absolute component refs with /root/ (slashes) are valid."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.display.label",
                         "meta": {"name": "MyLabel"},
@@ -465,11 +414,11 @@ class TestPropertyBindingPathValidation:
                             }
                         },
                     }
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_ROOT_DOT_PATH" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_ROOT_DOT_PATH" not in linter.codes
 
     def test_view_custom_path_not_flagged(self):
         """Correct view.custom.X paths should not be flagged."""
@@ -489,8 +438,8 @@ class TestPropertyBindingPathValidation:
                 },
             },
         }
-        issues = _lint_view(view)
-        assert "BINDING_ROOT_DOT_PATH" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_ROOT_DOT_PATH" not in linter.codes
 
 
 class TestBindingPathSyntax:
@@ -500,23 +449,20 @@ class TestBindingPathSyntax:
         """root.custom.X without leading / or view. scope is flagged."""
         view = {
             "custom": {"myProp": ""},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "property",
                             "config": {"path": "root.custom.myProp"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_BARE_ROOT_PATH" in _codes(issues)
-        issue = next(i for i in issues if i.code == "BINDING_BARE_ROOT_PATH")
+        linter = _lint_view(view)
+        assert "BINDING_BARE_ROOT_PATH" in linter.codes
+        issue = linter.issues_by_code["BINDING_BARE_ROOT_PATH"][0]
         assert "view.custom.myProp" in issue.suggestion
 
     def test_bare_root_params_flagged(self):
@@ -524,44 +470,38 @@ class TestBindingPathSyntax:
         view = {
             "custom": {},
             "params": {"item": ""},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "property",
                             "config": {"path": "root.params.item"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_BARE_ROOT_PATH" in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_BARE_ROOT_PATH" in linter.codes
 
     def test_invalid_scope_flagged(self):
         """A path with dots but no recognized scope prefix is flagged."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "property",
                             "config": {"path": "foo.bar.baz"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_INVALID_SCOPE" in _codes(issues)
-        issue = next(i for i in issues if i.code == "BINDING_INVALID_SCOPE")
+        linter = _lint_view(view)
+        assert "BINDING_INVALID_SCOPE" in linter.codes
+        issue = linter.issues_by_code["BINDING_INVALID_SCOPE"][0]
         assert "Valid scopes" in issue.suggestion
 
     def test_valid_scopes_not_flagged(self):
@@ -575,73 +515,64 @@ class TestBindingPathSyntax:
         ]:
             view = {
                 "custom": {"x": ""},
-                "root": {
-                    "type": "ia.display.label",
-                    "meta": {"name": "Label"},
-                    "children": [],
-                    "propConfig": {
+                "root": _label(
+                    propConfig={
                         "props.text": {
                             "binding": {
                                 "type": "property",
                                 "config": {"path": scope},
                             }
                         }
-                    },
-                },
+                    }
+                ),
             }
-            issues = _lint_view(view)
+            linter = _lint_view(view)
             scope_codes = {"BINDING_BARE_ROOT_PATH", "BINDING_INVALID_SCOPE"}
-            assert not scope_codes & _codes(issues), (
-                f"Scope '{scope}' was incorrectly flagged"
-            )
+            assert (
+                not scope_codes & linter.codes
+            ), f"Scope '{scope}' was incorrectly flagged"
 
     def test_relative_path_not_flagged(self):
         """Relative component refs (./ and ../) should pass syntax checks."""
         for path in ["./Sibling.props.text", "../Parent/Other.props.value"]:
             view = {
                 "custom": {},
-                "root": {
-                    "type": "ia.display.label",
-                    "meta": {"name": "Label"},
-                    "children": [],
-                    "propConfig": {
+                "root": _label(
+                    propConfig={
                         "props.text": {
                             "binding": {
                                 "type": "property",
                                 "config": {"path": path},
                             }
                         }
-                    },
-                },
+                    }
+                ),
             }
-            issues = _lint_view(view)
+            linter = _lint_view(view)
             syntax_codes = {"BINDING_BARE_ROOT_PATH", "BINDING_INVALID_SCOPE"}
-            assert not syntax_codes & _codes(issues), (
-                f"Path '{path}' was incorrectly flagged"
-            )
+            assert (
+                not syntax_codes & linter.codes
+            ), f"Path '{path}' was incorrectly flagged"
 
     def test_no_duplicate_for_root_dot(self):
         """BINDING_ROOT_DOT_PATH should not also trigger BINDING_INVALID_SCOPE."""
         view = {
             "custom": {"x": ""},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "property",
                             "config": {"path": "/root.custom.x"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_ROOT_DOT_PATH" in _codes(issues)
-        assert "BINDING_INVALID_SCOPE" not in _codes(issues)
-        assert "BINDING_BARE_ROOT_PATH" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_ROOT_DOT_PATH" in linter.codes
+        assert "BINDING_INVALID_SCOPE" not in linter.codes
+        assert "BINDING_BARE_ROOT_PATH" not in linter.codes
 
 
 class TestBindingPathResolution:
@@ -651,23 +582,20 @@ class TestBindingPathResolution:
         """Property binding to view.custom.X where X doesn't exist."""
         view = {
             "custom": {"realProp": ""},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "property",
                             "config": {"path": "view.custom.missingProp"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_VIEW_PROP_NOT_FOUND" in _codes(issues)
-        issue = next(i for i in issues if i.code == "BINDING_VIEW_PROP_NOT_FOUND")
+        linter = _lint_view(view)
+        assert "BINDING_VIEW_PROP_NOT_FOUND" in linter.codes
+        issue = linter.issues_by_code["BINDING_VIEW_PROP_NOT_FOUND"][0]
         assert "missingProp" in issue.message
 
     def test_binding_view_params_not_found(self):
@@ -675,85 +603,73 @@ class TestBindingPathResolution:
         view = {
             "custom": {},
             "params": {"realParam": ""},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "property",
                             "config": {"path": "view.params.missingParam"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_VIEW_PROP_NOT_FOUND" in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_VIEW_PROP_NOT_FOUND" in linter.codes
 
     def test_binding_view_custom_found(self):
         """Property binding to view.custom.X where X exists should pass."""
         view = {
             "custom": {"myProp": "hello"},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "property",
                             "config": {"path": "view.custom.myProp"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_VIEW_PROP_NOT_FOUND" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_VIEW_PROP_NOT_FOUND" not in linter.codes
 
     def test_binding_deep_path_checks_top_key_only(self):
         """view.custom.alarm.name only checks that 'alarm' exists, not 'alarm.name'."""
         view = {
             "custom": {"alarm": {"name": "Test"}},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "property",
                             "config": {"path": "view.custom.alarm.name"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_VIEW_PROP_NOT_FOUND" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_VIEW_PROP_NOT_FOUND" not in linter.codes
 
     def test_binding_array_index_stripped(self):
         """view.custom.items[0].x checks that 'items' exists."""
         view = {
             "custom": {"items": [1, 2, 3]},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "property",
                             "config": {"path": "view.custom.items[0].x"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_VIEW_PROP_NOT_FOUND" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_VIEW_PROP_NOT_FOUND" not in linter.codes
 
 
 class TestComponentPathResolution:
@@ -763,20 +679,12 @@ class TestComponentPathResolution:
         """A valid /root/Header/Label.props.text path should not be flagged."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.container.flex",
                         "meta": {"name": "Header"},
-                        "children": [
-                            {
-                                "type": "ia.display.label",
-                                "meta": {"name": "Label"},
-                                "children": [],
-                            }
-                        ],
+                        "children": [_label()],
                     },
                     {
                         "type": "ia.display.label",
@@ -791,30 +699,22 @@ class TestComponentPathResolution:
                             }
                         },
                     },
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_COMPONENT_NOT_FOUND" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_COMPONENT_NOT_FOUND" not in linter.codes
 
     def test_invalid_component_path_flagged(self):
         """A /root/Header/Missing.props.text path should be flagged."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.container.flex",
                         "meta": {"name": "Header"},
-                        "children": [
-                            {
-                                "type": "ia.display.label",
-                                "meta": {"name": "Label"},
-                                "children": [],
-                            }
-                        ],
+                        "children": [_label()],
                     },
                     {
                         "type": "ia.display.label",
@@ -831,12 +731,12 @@ class TestComponentPathResolution:
                             }
                         },
                     },
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_COMPONENT_NOT_FOUND" in _codes(issues)
-        issue = next(i for i in issues if i.code == "BINDING_COMPONENT_NOT_FOUND")
+        linter = _lint_view(view)
+        assert "BINDING_COMPONENT_NOT_FOUND" in linter.codes
+        issue = linter.issues_by_code["BINDING_COMPONENT_NOT_FOUND"][0]
         assert "Missing" in issue.message
         assert "Label" in issue.suggestion  # Should suggest available children
 
@@ -844,10 +744,8 @@ class TestComponentPathResolution:
         """A /root/Nonexistent.props.text path with wrong first child."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.display.label",
                         "meta": {"name": "Actual"},
@@ -861,22 +759,20 @@ class TestComponentPathResolution:
                             }
                         },
                     }
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_COMPONENT_NOT_FOUND" in _codes(issues)
-        issue = next(i for i in issues if i.code == "BINDING_COMPONENT_NOT_FOUND")
+        linter = _lint_view(view)
+        assert "BINDING_COMPONENT_NOT_FOUND" in linter.codes
+        issue = linter.issues_by_code["BINDING_COMPONENT_NOT_FOUND"][0]
         assert "Actual" in issue.suggestion
 
     def test_component_name_with_spaces(self):
         """Component names with spaces should be handled correctly."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.input.date-range",
                         "meta": {"name": "Date Range Picker"},
@@ -897,25 +793,19 @@ class TestComponentPathResolution:
                             }
                         },
                     },
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_COMPONENT_NOT_FOUND" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_COMPONENT_NOT_FOUND" not in linter.codes
 
     def test_no_children_at_leaf(self):
         """Path pointing through a leaf component (no children) is flagged."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
-                    {
-                        "type": "ia.display.label",
-                        "meta": {"name": "Label"},
-                        "children": [],
-                    },
+            "root": _flex_root(
+                children=[
+                    _label(),
                     {
                         "type": "ia.display.label",
                         "meta": {"name": "Consumer"},
@@ -929,12 +819,12 @@ class TestComponentPathResolution:
                             }
                         },
                     },
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_COMPONENT_NOT_FOUND" in _codes(issues)
-        issue = next(i for i in issues if i.code == "BINDING_COMPONENT_NOT_FOUND")
+        linter = _lint_view(view)
+        assert "BINDING_COMPONENT_NOT_FOUND" in linter.codes
+        issue = linter.issues_by_code["BINDING_COMPONENT_NOT_FOUND"][0]
         assert "Nested" in issue.message
         assert "No children" in issue.suggestion
 
@@ -946,11 +836,8 @@ class TestExpressionPathResolution:
         """{view.custom.missing} in an expression should be flagged."""
         view = {
             "custom": {"realProp": ""},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "expr",
@@ -959,12 +846,12 @@ class TestExpressionPathResolution:
                             },
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "EXPR_VIEW_PROP_NOT_FOUND" in _codes(issues)
-        issue = next(i for i in issues if i.code == "EXPR_VIEW_PROP_NOT_FOUND")
+        linter = _lint_view(view)
+        assert "EXPR_VIEW_PROP_NOT_FOUND" in linter.codes
+        issue = linter.issues_by_code["EXPR_VIEW_PROP_NOT_FOUND"][0]
         assert "missing" in issue.message
 
     def test_expr_view_params_not_found(self):
@@ -972,53 +859,44 @@ class TestExpressionPathResolution:
         view = {
             "custom": {},
             "params": {"existing": ""},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "expr",
                             "config": {"expression": "{view.params.missing}"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "EXPR_VIEW_PROP_NOT_FOUND" in _codes(issues)
+        linter = _lint_view(view)
+        assert "EXPR_VIEW_PROP_NOT_FOUND" in linter.codes
 
     def test_expr_view_custom_found(self):
         """{view.custom.X} where X exists should not be flagged."""
         view = {
             "custom": {"myProp": "hello"},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "expr",
                             "config": {"expression": "{view.custom.myProp}"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "EXPR_VIEW_PROP_NOT_FOUND" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "EXPR_VIEW_PROP_NOT_FOUND" not in linter.codes
 
     def test_expr_transform_view_ref_checked(self):
         """{view.custom.missing} in an expression transform should be flagged."""
         view = {
             "custom": {"realProp": ""},
-            "root": {
-                "type": "ia.display.label",
-                "meta": {"name": "Label"},
-                "children": [],
-                "propConfig": {
+            "root": _label(
+                propConfig={
                     "props.text": {
                         "binding": {
                             "type": "tag",
@@ -1031,11 +909,11 @@ class TestExpressionPathResolution:
                             ],
                         }
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        assert "EXPR_VIEW_PROP_NOT_FOUND" in _codes(issues)
+        linter = _lint_view(view)
+        assert "EXPR_VIEW_PROP_NOT_FOUND" in linter.codes
 
 
 class TestNonBindablePropertyDetection:
@@ -1050,10 +928,8 @@ class TestNonBindablePropertyDetection:
         """children is structural on containers — binding to it is always invalid."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.container.flex",
                         "meta": {"name": "SummaryBar"},
@@ -1067,13 +943,13 @@ class TestNonBindablePropertyDetection:
                             }
                         },
                     }
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        codes = _codes(issues)
+        linter = _lint_view(view)
+        codes = linter.codes
         assert "BINDING_NON_BINDABLE_PROPERTY" in codes
-        matching = [i for i in issues if i.code == "BINDING_NON_BINDABLE_PROPERTY"]
+        matching = linter.issues_by_code.get("BINDING_NON_BINDABLE_PROPERTY", [])
         assert len(matching) == 1
         assert "children" in matching[0].message
         assert matching[0].severity.value == "error"
@@ -1082,10 +958,8 @@ class TestNonBindablePropertyDetection:
         """type is structural — binding to it is invalid."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.display.label",
                         "meta": {"name": "Lbl"},
@@ -1098,21 +972,19 @@ class TestNonBindablePropertyDetection:
                             }
                         },
                     }
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_NON_BINDABLE_PROPERTY" in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_NON_BINDABLE_PROPERTY" in linter.codes
 
     def test_valid_scopes_not_flagged(self):
         """props.*, position.*, custom.*, meta.*, params.* are all valid scopes."""
         view = {
             "custom": {"myFlag": False},
             "params": {"myParam": ""},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.display.label",
                         "meta": {"name": "Lbl"},
@@ -1137,31 +1009,29 @@ class TestNonBindablePropertyDetection:
                             },
                         },
                     }
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_NON_BINDABLE_PROPERTY" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_NON_BINDABLE_PROPERTY" not in linter.codes
 
     def test_onchange_on_structural_property_flagged(self):
         """Even onChange (not just binding) on a structural key is invalid."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.container.flex",
                         "meta": {"name": "Container"},
                         "children": [],
                         "propConfig": {"children": {"onChange": {"script": "\tpass"}}},
                     }
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        assert "BINDING_NON_BINDABLE_PROPERTY" in _codes(issues)
+        linter = _lint_view(view)
+        assert "BINDING_NON_BINDABLE_PROPERTY" in linter.codes
 
     def test_view_level_structural_propconfig_flagged(self):
         """Structural keys in view-level propConfig should also be flagged."""
@@ -1175,24 +1045,18 @@ class TestNonBindablePropertyDetection:
                     }
                 }
             },
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [],
-            },
+            "root": _flex_root(),
         }
-        issues = _lint_view(view)
-        codes = _codes(issues)
+        linter = _lint_view(view)
+        codes = linter.codes
         assert "BINDING_NON_BINDABLE_PROPERTY" in codes
 
     def test_multiple_structural_keys_all_flagged(self):
         """Multiple invalid propConfig keys on the same component each get flagged."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [
+            "root": _flex_root(
+                children=[
                     {
                         "type": "ia.container.flex",
                         "meta": {"name": "Bad"},
@@ -1218,11 +1082,11 @@ class TestNonBindablePropertyDetection:
                             },
                         },
                     }
-                ],
-            },
+                ]
+            ),
         }
-        issues = _lint_view(view)
-        matching = [i for i in issues if i.code == "BINDING_NON_BINDABLE_PROPERTY"]
+        linter = _lint_view(view)
+        matching = linter.issues_by_code.get("BINDING_NON_BINDABLE_PROPERTY", [])
         flagged_keys = {i.message.split("'")[1] for i in matching}
         assert flagged_keys == {"children", "type"}
 
@@ -1230,11 +1094,7 @@ class TestNonBindablePropertyDetection:
 class TestParamDirectionValidation:
     """Tests for MISSING_PARAM_DIRECTION rule."""
 
-    _BASE_ROOT = {
-        "type": "ia.container.flex",
-        "meta": {"name": "Root"},
-        "children": [],
-    }
+    _BASE_ROOT = _flex_root()
 
     def test_param_no_propconfig_warns(self):
         """Params defined with no propConfig at all — the exact bug scenario."""
@@ -1243,8 +1103,8 @@ class TestParamDirectionValidation:
             "params": {"itemId": 0, "mode": "view"},
             "root": self._BASE_ROOT,
         }
-        issues = _lint_view(view)
-        param_issues = [i for i in issues if i.code == "MISSING_PARAM_DIRECTION"]
+        linter = _lint_view(view)
+        param_issues = linter.issues_by_code.get("MISSING_PARAM_DIRECTION", [])
         assert len(param_issues) == 2
         names = {i.component_path for i in param_issues}
         assert names == {"params.itemId", "params.mode"}
@@ -1262,9 +1122,9 @@ class TestParamDirectionValidation:
             },
             "root": self._BASE_ROOT,
         }
-        issues = _lint_view(view)
-        assert "MISSING_PARAM_DIRECTION" in _codes(issues)
-        matching = [i for i in issues if i.code == "MISSING_PARAM_DIRECTION"]
+        linter = _lint_view(view)
+        assert "MISSING_PARAM_DIRECTION" in linter.codes
+        matching = linter.issues_by_code.get("MISSING_PARAM_DIRECTION", [])
         assert len(matching) == 1
         assert matching[0].component_path == "propConfig.params.cameraID"
 
@@ -1281,8 +1141,8 @@ class TestParamDirectionValidation:
             },
             "root": self._BASE_ROOT,
         }
-        issues = _lint_view(view)
-        assert "MISSING_PARAM_DIRECTION" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "MISSING_PARAM_DIRECTION" not in linter.codes
 
     def test_empty_params_no_warning(self):
         """Empty params dict should not trigger any warnings."""
@@ -1291,8 +1151,8 @@ class TestParamDirectionValidation:
             "params": {},
             "root": self._BASE_ROOT,
         }
-        issues = _lint_view(view)
-        assert "MISSING_PARAM_DIRECTION" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "MISSING_PARAM_DIRECTION" not in linter.codes
 
     def test_multiple_params_partial_propconfig(self):
         """Two params, one configured and one not — exactly one warning."""
@@ -1307,8 +1167,8 @@ class TestParamDirectionValidation:
             },
             "root": self._BASE_ROOT,
         }
-        issues = _lint_view(view)
-        matching = [i for i in issues if i.code == "MISSING_PARAM_DIRECTION"]
+        linter = _lint_view(view)
+        matching = linter.issues_by_code.get("MISSING_PARAM_DIRECTION", [])
         assert len(matching) == 1
         assert matching[0].component_path == "params.mode"
 
@@ -1318,11 +1178,7 @@ class TestEventWrongCategory:
 
     _BASE_VIEW = {
         "custom": {},
-        "root": {
-            "type": "ia.container.flex",
-            "meta": {"name": "Root"},
-            "children": [],
-        },
+        "root": _flex_root(),
     }
 
     @staticmethod
@@ -1330,44 +1186,41 @@ class TestEventWrongCategory:
         """Build a minimal view.json with a single event handler."""
         return {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [],
-                "events": {
+            "root": _flex_root(
+                events={
                     category: {
                         event_name: {
                             "type": "script",
                             "config": {"script": "\tpass"},
                         }
                     }
-                },
-            },
+                }
+            ),
         }
 
     def test_correct_system_event(self):
         """onStartup under events.system should not flag."""
         view = self._make_view_with_event("system", "onStartup")
-        issues = _lint_view(view)
-        assert "EVENT_WRONG_CATEGORY" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "EVENT_WRONG_CATEGORY" not in linter.codes
 
     def test_correct_mouse_event(self):
         """onClick under events.mouse should not flag."""
         view = self._make_view_with_event("mouse", "onClick")
-        issues = _lint_view(view)
-        assert "EVENT_WRONG_CATEGORY" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "EVENT_WRONG_CATEGORY" not in linter.codes
 
     def test_correct_component_event(self):
         """onActionPerformed under events.component should not flag."""
         view = self._make_view_with_event("component", "onActionPerformed")
-        issues = _lint_view(view)
-        assert "EVENT_WRONG_CATEGORY" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "EVENT_WRONG_CATEGORY" not in linter.codes
 
     def test_system_event_under_component(self):
         """onStartup under events.component should flag."""
         view = self._make_view_with_event("component", "onStartup")
-        issues = _lint_view(view)
-        matching = [i for i in issues if i.code == "EVENT_WRONG_CATEGORY"]
+        linter = _lint_view(view)
+        matching = linter.issues_by_code.get("EVENT_WRONG_CATEGORY", [])
         assert len(matching) == 1
         assert "system event" in matching[0].message
         assert matching[0].suggestion == "Move to events.system.onStartup"
@@ -1375,8 +1228,8 @@ class TestEventWrongCategory:
     def test_mouse_event_under_system(self):
         """onClick under events.system should flag."""
         view = self._make_view_with_event("system", "onClick")
-        issues = _lint_view(view)
-        matching = [i for i in issues if i.code == "EVENT_WRONG_CATEGORY"]
+        linter = _lint_view(view)
+        matching = linter.issues_by_code.get("EVENT_WRONG_CATEGORY", [])
         assert len(matching) == 1
         assert "mouse event" in matching[0].message
         assert matching[0].suggestion == "Move to events.mouse.onClick"
@@ -1384,42 +1237,39 @@ class TestEventWrongCategory:
     def test_keyboard_event_under_mouse(self):
         """onKeyDown under events.mouse should flag."""
         view = self._make_view_with_event("mouse", "onKeyDown")
-        issues = _lint_view(view)
-        matching = [i for i in issues if i.code == "EVENT_WRONG_CATEGORY"]
+        linter = _lint_view(view)
+        matching = linter.issues_by_code.get("EVENT_WRONG_CATEGORY", [])
         assert len(matching) == 1
         assert matching[0].suggestion == "Move to events.keyboard.onKeyDown"
 
     def test_focus_event_under_component(self):
         """onBlur under events.component should flag."""
         view = self._make_view_with_event("component", "onBlur")
-        issues = _lint_view(view)
-        matching = [i for i in issues if i.code == "EVENT_WRONG_CATEGORY"]
+        linter = _lint_view(view)
+        matching = linter.issues_by_code.get("EVENT_WRONG_CATEGORY", [])
         assert len(matching) == 1
         assert matching[0].suggestion == "Move to events.focus.onBlur"
 
     def test_pointer_event_under_mouse(self):
         """onPointerDown under events.mouse should flag."""
         view = self._make_view_with_event("mouse", "onPointerDown")
-        issues = _lint_view(view)
-        matching = [i for i in issues if i.code == "EVENT_WRONG_CATEGORY"]
+        linter = _lint_view(view)
+        matching = linter.issues_by_code.get("EVENT_WRONG_CATEGORY", [])
         assert len(matching) == 1
         assert matching[0].suggestion == "Move to events.pointer.onPointerDown"
 
     def test_unknown_event_not_flagged(self):
         """Custom/unknown events should not trigger this rule."""
         view = self._make_view_with_event("component", "onCustomThing")
-        issues = _lint_view(view)
-        assert "EVENT_WRONG_CATEGORY" not in _codes(issues)
+        linter = _lint_view(view)
+        assert "EVENT_WRONG_CATEGORY" not in linter.codes
 
     def test_multiple_wrong_events(self):
         """Multiple misplaced events should each produce a separate issue."""
         view = {
             "custom": {},
-            "root": {
-                "type": "ia.container.flex",
-                "meta": {"name": "Root"},
-                "children": [],
-                "events": {
+            "root": _flex_root(
+                events={
                     "component": {
                         "onStartup": {
                             "type": "script",
@@ -1430,11 +1280,67 @@ class TestEventWrongCategory:
                             "config": {"script": "\tpass"},
                         },
                     }
-                },
-            },
+                }
+            ),
         }
-        issues = _lint_view(view)
-        matching = [i for i in issues if i.code == "EVENT_WRONG_CATEGORY"]
+        linter = _lint_view(view)
+        matching = linter.issues_by_code.get("EVENT_WRONG_CATEGORY", [])
         assert len(matching) == 2
         event_names = {m.message.split("'")[1] for m in matching}
         assert event_names == {"onStartup", "onShutdown"}
+
+
+class TestLintFile:
+    """Tests for reading view.json files from disk."""
+
+    def test_invalid_json_uses_stdlib_message(self, tmp_path):
+        """INVALID_JSON wording does not depend on which parser is installed."""
+        path = tmp_path / "view.json"
+        path.write_text('{"root": {"type": "ia.container.flex",}}')
+        linter = IgnitionPerspectiveLinter()
+        assert not linter.lint_file(str(path))
+        (issue,) = linter.issues_by_code["INVALID_JSON"]
+        assert (
+            issue.suggestion
+            == "Line 1: Expecting property name enclosed in double quotes"
+        )
+
+    def test_stats_match_lint_data(self, tmp_path):
+        """lint_file and lint_data count files and components the same way."""
+        view = {"custom": {}, "root": _flex_root(children=[_label()])}
+        path = tmp_path / "view.json"
+        path.write_text(json.dumps(view))
+
+        from_file = IgnitionPerspectiveLinter()
+        from_file.lint_file(str(path))
+        in_memory = IgnitionPerspectiveLinter()
+        in_memory.lint_data(view, str(path))
+
+        assert in_memory.component_stats == from_file.component_stats
+        assert in_memory.component_stats["total_files"] == 1
+        assert in_memory.component_stats["total_components"] == 2
+
+    def test_nan_literal_accepted(self, tmp_path):
+        """Non-standard NaN literals are parsed the way the stdlib parses them."""
+        view = {"custom": {"ratio": "NaN"}, "root": _flex_root()}
+        path = tmp_path / "view.json"
+        path.write_text(json.dumps(view).replace('"NaN"', "NaN"))
+        linter = IgnitionPerspectiveLinter()
+        linter.lint_file(str(path))
+        assert "INVALID_JSON" not in linter.codes
+
+
+class TestIssueIndex:
+    """codes / issues_by_code always reflect the current issue list."""
+
+    def test_views_follow_direct_issue_changes(self):
+        linter = _lint_view({"custom": {}, "root": _flex_root()})
+        assert "SCHEMA_VALIDATION" not in linter.codes
+
+        linter.validate_component_schema(_label(position="x"), "<memory>", "root/L")
+        assert "SCHEMA_VALIDATION" in linter.codes
+        assert len(linter.issues_by_code["SCHEMA_VALIDATION"]) == 1
+
+        linter.issues.clear()
+        assert linter.codes == frozenset()
+        assert linter.issues_by_code == {}
@@ -20,3 +20,7 @@ def test_schema_path_is_json(mode):
 def test_invalid_mode_raises():
     with pytest.raises(ValueError, match="Unknown schema mode"):
         schema_path_for("nonexistent")
+
+
+def test_repeat_lookup_is_cached():
+    assert schema_path_for("robust") is schema_path_for("robust")
@@ -1,11 +1,11 @@
 """Tests for IgnitionTagLinter — tag/UDT JSON structural validation."""
 
 import json
-import os
-import tempfile
+from types import MappingProxyType
 
 import pytest
 
+from ignition_lint.reporting import LintSeverity
 from ignition_lint.schemas import tag_schema_path_for
 from ignition_lint.tags import IgnitionTagLinter
 
@@ -14,31 +14,21 @@ from ignition_lint.tags import IgnitionTagLinter
 # ---------------------------------------------------------------------------
 
 
-def _lint_tag(tag_data):
-    """Write tag_data to a temp JSON file and lint it."""
-    linter = IgnitionTagLinter()
-    tmpdir = tempfile.mkdtemp()
-    path = os.path.join(tmpdir, "tags.json")
-    with open(path, "w") as f:
-        json.dump(tag_data, f)
+# Read-only so a test cannot leak changes into the others
+_ATOMIC_TAG = MappingProxyType(
+    {"name": "T", "tagType": "AtomicTag", "dataType": "Int4", "valueSource": "memory"}
+)
 
-    try:
-        linter.lint_file(path)
-    finally:
-        os.unlink(path)
-        os.rmdir(tmpdir)
 
-    return linter.issues
+def _atomic_tag(**overrides):
+    """Helper: a memory AtomicTag with ``overrides`` applied."""
+    return {**_ATOMIC_TAG, **overrides}
 
 
-def _codes(issues):
-    """Extract the set of issue codes."""
-    return {i.code for i in issues}
-
-
-def _issues_with_code(issues, code):
-    """Filter issues by code."""
-    return [i for i in issues if i.code == code]
+def _lint_tag(linter, tag_data):
+    """Lint tag_data in memory with the ``tag_linter`` fixture."""
+    linter.lint_data(tag_data)
+    return linter
 
 
 # ---------------------------------------------------------------------------
@@ -47,54 +37,57 @@ def _issues_with_code(issues, code):
 
 
 class TestTagTypeValidation:
-    def test_valid_atomic_tag(self):
-        tag = {
-            "name": "MyTag",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "memory",
-        }
-        issues = _lint_tag(tag)
-        assert "INVALID_TAG_TYPE" not in _codes(issues)
-        assert "MISSING_TAG_NAME" not in _codes(issues)
+    def test_valid_atomic_tag(self, tag_linter):
+        linter = _lint_tag(tag_linter, _atomic_tag())
+        assert "INVALID_TAG_TYPE" not in linter.codes
+        assert "MISSING_TAG_NAME" not in linter.codes
 
-    def test_valid_folder(self):
+    def test_valid_folder(self, tag_linter):
         tag = {"name": "Folder1", "tagType": "Folder", "tags": []}
-        issues = _lint_tag(tag)
-        assert "INVALID_TAG_TYPE" not in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "INVALID_TAG_TYPE" not in linter.codes
 
-    def test_valid_udt_type(self):
+    def test_valid_udt_type(self, tag_linter):
         tag = {
             "name": "MyUDT",
             "tagType": "UdtType",
             "typeId": "custom/MyUDT",
             "tags": [],
         }
-        issues = _lint_tag(tag)
-        assert "INVALID_TAG_TYPE" not in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "INVALID_TAG_TYPE" not in linter.codes
 
-    def test_valid_udt_instance(self):
+    def test_valid_udt_instance(self, tag_linter):
         tag = {"name": "Inst1", "tagType": "UdtInstance", "typeId": "custom/MyUDT"}
-        issues = _lint_tag(tag)
-        assert "INVALID_TAG_TYPE" not in _codes(issues)
-        assert "MISSING_TYPE_ID" not in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "INVALID_TAG_TYPE" not in linter.codes
+        assert "MISSING_TYPE_ID" not in linter.codes
 
-    def test_invalid_tag_type(self):
+    def test_invalid_tag_type(self, tag_linter):
         tag = {"name": "Bad", "tagType": "InvalidType"}
-        issues = _lint_tag(tag)
-        assert "INVALID_TAG_TYPE" in _codes(issues)
-
-    def test_missing_name_info_severity(self):
+        linter = _lint_tag(tag_linter, tag)
+        issue = linter.issues_by_code["INVALID_TAG_TYPE"][0]
+        assert issue.suggestion == (
+            "Valid values: AtomicTag, Folder, Provider, UdtInstance, UdtType"
+        )
+
+    def test_schema_violation_reported(self, tag_linter):
+        tag = {"name": "T", "tagType": "AtomicTag", "dataType": "Int4", "enabled": 1}
+        linter = _lint_tag(tag_linter, tag)
+        issue = linter.issues_by_code["SCHEMA_VALIDATION"][0]
+        assert "not of type 'boolean'" in issue.message
+        assert issue.suggestion == "Path: enabled"
+        assert issue.metadata["search_key"] == '"enabled"'
+
+    def test_missing_name_info_severity(self, tag_linter):
         """Missing name is INFO (not ERROR) since git module uses filename as name."""
         tag = {"tagType": "AtomicTag", "dataType": "Int4"}
-        issues = _lint_tag(tag)
-        assert "MISSING_TAG_NAME" in _codes(issues)
-        name_issues = _issues_with_code(issues, "MISSING_TAG_NAME")
-        from ignition_lint.reporting import LintSeverity
-
+        linter = _lint_tag(tag_linter, tag)
+        assert "MISSING_TAG_NAME" in linter.codes
+        name_issues = linter.issues_by_code.get("MISSING_TAG_NAME", [])
         assert all(i.severity == LintSeverity.INFO for i in name_issues)
 
-    def test_file_per_tag_udt_no_errors(self):
+    def test_file_per_tag_udt_no_errors(self, tag_linter):
         """UdtType without root name (file-per-tag format) should not produce errors."""
         tag = {
             "tagType": "UdtType",
@@ -107,8 +100,8 @@ class TestTagTypeValidation:
                 },
             ],
         }
-        issues = _lint_tag(tag)
-        errors = [i for i in issues if i.severity.value == "error"]
+        linter = _lint_tag(tag_linter, tag)
+        errors = [i for i in linter.issues if i.severity.value == "error"]
         assert errors == []
 
 
@@ -118,109 +111,73 @@ class TestTagTypeValidation:
 
 
 class TestAtomicTagValidation:
-    def test_missing_data_type(self):
+    def test_missing_data_type(self, tag_linter):
         tag = {"name": "NoData", "tagType": "AtomicTag", "valueSource": "memory"}
-        issues = _lint_tag(tag)
-        assert "MISSING_DATA_TYPE" in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "MISSING_DATA_TYPE" in linter.codes
 
-    def test_missing_value_source(self):
+    def test_missing_value_source(self, tag_linter):
         tag = {"name": "NoVS", "tagType": "AtomicTag", "dataType": "Int4"}
-        issues = _lint_tag(tag)
-        assert "MISSING_VALUE_SOURCE" in _codes(issues)
-
-    def test_complete_tag_no_missing_warnings(self):
-        tag = {
-            "name": "Complete",
-            "tagType": "AtomicTag",
-            "dataType": "Float8",
-            "valueSource": "memory",
-            "value": 3.14,
-        }
-        issues = _lint_tag(tag)
-        assert "MISSING_DATA_TYPE" not in _codes(issues)
-        assert "MISSING_VALUE_SOURCE" not in _codes(issues)
-
-    def test_opc_missing_config(self):
-        tag = {
-            "name": "OpcTag",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "opc",
-        }
-        issues = _lint_tag(tag)
-        assert "OPC_MISSING_CONFIG" in _codes(issues)
-
-    def test_opc_with_config_no_warning(self):
-        tag = {
-            "name": "OpcTag",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "opc",
-            "opcServer": "Ignition OPC UA Server",
-            "opcItemPath": "ns=1;s=Channel1.Device1.Tag1",
-        }
-        issues = _lint_tag(tag)
-        assert "OPC_MISSING_CONFIG" not in _codes(issues)
-
-    def test_expr_missing_expression(self):
-        tag = {
-            "name": "ExprTag",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "expr",
-        }
-        issues = _lint_tag(tag)
-        assert "EXPR_MISSING_EXPRESSION" in _codes(issues)
-
-    def test_expr_with_expression_no_error(self):
-        tag = {
-            "name": "ExprTag",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "expr",
-            "expression": "{[default]Path/To/Tag} + 1",
-        }
-        issues = _lint_tag(tag)
-        assert "EXPR_MISSING_EXPRESSION" not in _codes(issues)
-
-    def test_db_missing_query(self):
-        tag = {
-            "name": "DbTag",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "db",
+        linter = _lint_tag(tag_linter, tag)
+        assert "MISSING_VALUE_SOURCE" in linter.codes
+
+    def test_complete_tag_no_missing_warnings(self, tag_linter):
+        linter = _lint_tag(tag_linter, _atomic_tag(dataType="Float8", value=3.14))
+        assert "MISSING_DATA_TYPE" not in linter.codes
+        assert "MISSING_VALUE_SOURCE" not in linter.codes
+
+    def test_opc_missing_config(self, tag_linter):
+        linter = _lint_tag(tag_linter, _atomic_tag(valueSource="opc"))
+        assert "OPC_MISSING_CONFIG" in linter.codes
+
+    def test_opc_with_config_no_warning(self, tag_linter):
+        tag = _atomic_tag(
+            valueSource="opc",
+            opcServer="Ignition OPC UA Server",
+            opcItemPath="ns=1;s=Channel1.Device1.Tag1",
+        )
+        linter = _lint_tag(tag_linter, tag)
+        assert "OPC_MISSING_CONFIG" not in linter.codes
+
+    def test_expr_missing_expression(self, tag_linter):
+        linter = _lint_tag(tag_linter, _atomic_tag(valueSource="expr"))
+        assert "EXPR_MISSING_EXPRESSION" in linter.codes
+
+    def test_expr_with_expression_no_error(self, tag_linter):
+        tag = _atomic_tag(valueSource="expr", expression="{[default]Path/To/Tag} + 1")
+        linter = _lint_tag(tag_linter, tag)
+        assert "EXPR_MISSING_EXPRESSION" not in linter.codes
+
+    def test_db_missing_query(self, tag_linter):
+        linter = _lint_tag(tag_linter, _atomic_tag(valueSource="db"))
+        assert "DB_MISSING_QUERY" in linter.codes
+
+    def test_unhashable_value_source_ignored(self, tag_linter):
+        linter = _lint_tag(tag_linter, _atomic_tag(valueSource=[]))
+        assert not linter.codes & {
+            "OPC_MISSING_CONFIG",
+            "EXPR_MISSING_EXPRESSION",
+            "DB_MISSING_QUERY",
         }
-        issues = _lint_tag(tag)
-        assert "DB_MISSING_QUERY" in _codes(issues)
 
-    def test_unknown_prop_flagged(self):
-        tag = {
-            "name": "Typo",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "memory",
-            "taqGroup": "Default",  # typo: should be tagGroup
-        }
-        issues = _lint_tag(tag)
-        assert "UNKNOWN_TAG_PROP" in _codes(issues)
-        unknown_issues = _issues_with_code(issues, "UNKNOWN_TAG_PROP")
+    def test_unknown_prop_flagged(self, tag_linter):
+        tag = _atomic_tag(taqGroup="Default")  # typo: should be tagGroup
+        linter = _lint_tag(tag_linter, tag)
+        assert "UNKNOWN_TAG_PROP" in linter.codes
+        unknown_issues = linter.issues_by_code.get("UNKNOWN_TAG_PROP", [])
         assert any("taqGroup" in i.message for i in unknown_issues)
 
-    def test_binding_object_not_flagged(self):
+    def test_binding_object_not_flagged(self, tag_linter):
         """Binding objects (dict with bindType) should not trigger UNKNOWN_TAG_PROP."""
-        tag = {
-            "name": "BoundTag",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "memory",
-            "customProp": {
+        tag = _atomic_tag(
+            customProp={
                 "bindType": "property",
                 "binding": "[default]some/path",
                 "value": 0,
-            },
-        }
-        issues = _lint_tag(tag)
-        unknown = _issues_with_code(issues, "UNKNOWN_TAG_PROP")
+            }
+        )
+        linter = _lint_tag(tag_linter, tag)
+        unknown = linter.issues_by_code.get("UNKNOWN_TAG_PROP", [])
         assert not any("customProp" in i.message for i in unknown)
 
 
@@ -230,17 +187,17 @@ class TestAtomicTagValidation:
 
 
 class TestUdtValidation:
-    def test_udt_instance_missing_type_id(self):
+    def test_udt_instance_missing_type_id(self, tag_linter):
         tag = {"name": "NoType", "tagType": "UdtInstance"}
-        issues = _lint_tag(tag)
-        assert "MISSING_TYPE_ID" in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "MISSING_TYPE_ID" in linter.codes
 
-    def test_udt_instance_with_type_id(self):
+    def test_udt_instance_with_type_id(self, tag_linter):
         tag = {"name": "HasType", "tagType": "UdtInstance", "typeId": "custom/MyUDT"}
-        issues = _lint_tag(tag)
-        assert "MISSING_TYPE_ID" not in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "MISSING_TYPE_ID" not in linter.codes
 
-    def test_udt_type_custom_param_fields_not_flagged(self):
+    def test_udt_type_custom_param_fields_not_flagged(self, tag_linter):
         """UdtType should NOT get UNKNOWN_TAG_PROP for custom parameter fields."""
         tag = {
             "name": "MyUDT",
@@ -249,8 +206,8 @@ class TestUdtValidation:
             "parameters": {"Prefix": {"dataType": "String", "value": ""}},
             "customField": "some value",
         }
-        issues = _lint_tag(tag)
-        assert "UNKNOWN_TAG_PROP" not in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "UNKNOWN_TAG_PROP" not in linter.codes
 
 
 # ---------------------------------------------------------------------------
@@ -259,46 +216,36 @@ class TestUdtValidation:
 
 
 class TestEventScriptValidation:
-    def test_dict_format_valid_script(self):
-        tag = {
-            "name": "ScriptTag",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "memory",
-            "eventScripts": {
+    def test_dict_format_valid_script(self, tag_linter):
+        tag = _atomic_tag(
+            eventScripts={
                 "valueChanged": {
                     "eventScript": "x = 1\n",
                     "enabled": True,
                 }
-            },
-        }
-        issues = _lint_tag(tag)
-        assert "JYTHON_SYNTAX_ERROR" not in _codes(issues)
-
-    def test_array_format_valid_script(self):
-        tag = {
-            "name": "ArrayScript",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "memory",
-            "eventScripts": [
+            }
+        )
+        linter = _lint_tag(tag_linter, tag)
+        assert "JYTHON_SYNTAX_ERROR" not in linter.codes
+
+    def test_array_format_valid_script(self, tag_linter):
+        tag = _atomic_tag(
+            eventScripts=[
                 {"eventid": "valueChanged", "script": "y = 2\n", "enabled": True}
-            ],
-        }
-        issues = _lint_tag(tag)
-        assert "JYTHON_SYNTAX_ERROR" not in _codes(issues)
-
-    def test_empty_scripts_skipped(self):
-        tag = {
-            "name": "EmptyScript",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "memory",
-            "eventScripts": {"valueChanged": {"eventScript": "", "enabled": False}},
-        }
-        issues = _lint_tag(tag)
+            ]
+        )
+        linter = _lint_tag(tag_linter, tag)
+        assert "JYTHON_SYNTAX_ERROR" not in linter.codes
+
+    def test_empty_scripts_skipped(self, tag_linter):
+        tag = _atomic_tag(
+            eventScripts={"valueChanged": {"eventScript": "", "enabled": False}}
+        )
+        linter = _lint_tag(tag_linter, tag)
         # No script issues — script was empty
-        script_issues = [i for i in issues if "JYTHON" in i.code or "SYNTAX" in i.code]
+        script_issues = [
+            i for i in linter.issues if "JYTHON" in i.code or "SYNTAX" in i.code
+        ]
         assert script_issues == []
 
 
@@ -308,7 +255,7 @@ class TestEventScriptValidation:
 
 
 class TestNestedTags:
-    def test_folder_children_validated(self):
+    def test_folder_children_validated(self, tag_linter):
         tag = {
             "name": "Folder",
             "tagType": "Folder",
@@ -316,11 +263,11 @@ class TestNestedTags:
                 {"name": "Child", "tagType": "AtomicTag"},
             ],
         }
-        issues = _lint_tag(tag)
+        linter = _lint_tag(tag_linter, tag)
         # Child should get MISSING_DATA_TYPE
-        assert "MISSING_DATA_TYPE" in _codes(issues)
+        assert "MISSING_DATA_TYPE" in linter.codes
 
-    def test_deep_nesting(self):
+    def test_deep_nesting(self, tag_linter):
         tag = {
             "name": "L1",
             "tagType": "Folder",
@@ -339,12 +286,95 @@ class TestNestedTags:
                 }
             ],
         }
-        issues = _lint_tag(tag)
+        linter = _lint_tag(tag_linter, tag)
         # L3 is expr but no expression
-        assert "EXPR_MISSING_EXPRESSION" in _codes(issues)
-        expr_issues = _issues_with_code(issues, "EXPR_MISSING_EXPRESSION")
+        assert "EXPR_MISSING_EXPRESSION" in linter.codes
+        expr_issues = linter.issues_by_code.get("EXPR_MISSING_EXPRESSION", [])
         assert any("L3" in i.component_path for i in expr_issues)
 
+    def test_issues_follow_document_order(self, tag_linter):
+        def folder(name, *tags):
+            return {"name": name, "tagType": "Folder", "tags": list(tags)}
+
+        leaf = {"tagType": "AtomicTag", "dataType": "Int4", "valueSource": "memory"}
+        tag = folder(
+            "Root",
+            folder("A", {**leaf, "name": "a1"}, folder("A2", {**leaf, "name": "a2"})),
+            {**leaf, "name": "b"},
+        )
+        tag["documentation"] = 1  # schema error on Root itself
+        for node in (tag["tags"][0]["tags"][0], tag["tags"][0]["tags"][1]["tags"][0]):
+            node["taqGroup"] = "x"
+        tag["tags"][1]["taqGroup"] = "x"
+
+        linter = _lint_tag(tag_linter, tag)
+        paths = [i.component_path for i in linter.issues]
+        assert paths == [
+            "Root",
+            "Root/tags[0]/A/tags[0]/a1",
+            "Root/tags[0]/A/tags[1]/A2/tags[0]/a2",
+            "Root/tags[1]/b",
+        ]
+
+    def test_nested_schema_error_reported_on_child(self, tag_linter):
+        good = {"name": "Good", "tagType": "AtomicTag", "dataType": "Int4"}
+        bad = {"name": "Bad", "tagType": "AtomicTag", "enabled": "yes"}
+        tag = {
+            "name": "L1",
+            "tagType": "Folder",
+            "tags": [
+                {"name": "L2", "tagType": "Folder", "tags": [good]},
+                {"name": "L2b", "tagType": "Folder", "tags": [bad]},
+            ],
+        }
+        linter = _lint_tag(tag_linter, tag)
+        paths = [i.component_path for i in linter.issues_by_code["SCHEMA_VALIDATION"]]
+        assert paths[-1] == "L1/tags[1]/L2b/tags[0]/Bad"
+        assert not any("Good" in p for p in paths)
+
+    def test_fast_schema_check_matches_jsonschema(self, tag_linter):
+        pytest.importorskip("fastjsonschema")
+        tag = {
+            "name": "L1",
+            "tagType": "Folder",
+            "tags": [
+                {"name": "Ok", "tagType": "AtomicTag", "dataType": "Int4"},
+                {"name": "Bad", "tagType": "AtomicTag", "enabled": "yes"},
+                {"name": "Sub", "tagType": "Folder", "extra": 1},
+            ],
+        }
+        fast = _lint_tag(tag_linter, tag)
+        assert fast._fast_schema_check is not None
+
+        full = IgnitionTagLinter()
+        full._fast_schema_check = None
+        full.lint_data(tag)
+        assert fast.issues == full.issues
+
+    def test_fast_schema_check_leaves_input_unchanged(self, tmp_path):
+        pytest.importorskip("fastjsonschema")
+        schema = {
+            "type": "object",
+            "properties": {
+                "valueSource": {"type": "string", "default": "memory"},
+                "dataType": {"type": "string", "default": "Int4"},
+            },
+        }
+        schema_file = tmp_path / "schema-with-defaults.json"
+        schema_file.write_text(json.dumps(schema))
+        tag = {"name": "T", "tagType": "AtomicTag"}
+
+        fast = IgnitionTagLinter(schema_path=str(schema_file))
+        assert fast._fast_schema_check is not None
+        fast.lint_data(tag)
+        assert tag == {"name": "T", "tagType": "AtomicTag"}
+
+        full = IgnitionTagLinter(schema_path=str(schema_file))
+        full._fast_schema_check = None
+        full.lint_data(tag)
+        assert fast.issues == full.issues
+        assert {"MISSING_VALUE_SOURCE", "MISSING_DATA_TYPE"} <= fast.codes
+
 
 # ---------------------------------------------------------------------------
 # TestHistoryValidation
@@ -352,28 +382,15 @@ class TestNestedTags:
 
 
 class TestHistoryValidation:
-    def test_history_no_provider(self):
-        tag = {
-            "name": "HistTag",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "memory",
-            "historyEnabled": True,
-        }
-        issues = _lint_tag(tag)
-        assert "HISTORY_NO_PROVIDER" in _codes(issues)
+    def test_history_no_provider(self, tag_linter):
+        tag = _atomic_tag(historyEnabled=True)
+        linter = _lint_tag(tag_linter, tag)
+        assert "HISTORY_NO_PROVIDER" in linter.codes
 
-    def test_history_with_provider(self):
-        tag = {
-            "name": "HistTag",
-            "tagType": "AtomicTag",
-            "dataType": "Int4",
-            "valueSource": "memory",
-            "historyEnabled": True,
-            "historyProvider": "default",
-        }
-        issues = _lint_tag(tag)
-        assert "HISTORY_NO_PROVIDER" not in _codes(issues)
+    def test_history_with_provider(self, tag_linter):
+        tag = _atomic_tag(historyEnabled=True, historyProvider="default")
+        linter = _lint_tag(tag_linter, tag)
+        assert "HISTORY_NO_PROVIDER" not in linter.codes
 
 
 # ---------------------------------------------------------------------------
@@ -394,6 +411,17 @@ class TestSchemaResolution:
         with pytest.raises(ValueError, match="Unknown tag schema mode"):
             tag_schema_path_for("nonexistent")
 
+    def test_schema_validator_shared_between_linters(self):
+        first = IgnitionTagLinter()
+        second = IgnitionTagLinter(schema_path=str(tag_schema_path_for("robust")))
+        assert first._schema_validator is not None
+        assert first._schema_validator is second._schema_validator
+        assert first._fast_schema_check is second._fast_schema_check
+
+    def test_missing_schema_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="Tag schema file not found"):
+            IgnitionTagLinter(schema_path=str(tmp_path / "missing.json"))
+
 
 # ---------------------------------------------------------------------------
 # TestUdtInstanceContextAwareness
@@ -404,7 +432,7 @@ class TestUdtInstanceContextAwareness:
     """UdtInstance children should NOT get MISSING_DATA_TYPE or MISSING_VALUE_SOURCE
     because their dataType/valueSource are inherited from the UDT definition."""
 
-    def test_atomic_child_of_udt_instance_no_missing_data_type(self):
+    def test_atomic_child_of_udt_instance_no_missing_data_type(self, tag_linter):
         """AtomicTag directly inside UdtInstance: no MISSING_DATA_TYPE."""
         tag = {
             "name": "Inst1",
@@ -414,10 +442,10 @@ class TestUdtInstanceContextAwareness:
                 {"name": "Member1", "tagType": "AtomicTag", "valueSource": "memory"},
             ],
         }
-        issues = _lint_tag(tag)
-        assert "MISSING_DATA_TYPE" not in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "MISSING_DATA_TYPE" not in linter.codes
 
-    def test_atomic_child_of_udt_type_missing_data_type_is_warning(self):
+    def test_atomic_child_of_udt_type_missing_data_type_is_warning(self, tag_linter):
         """AtomicTag inside UdtType is a definition — should still be WARNING."""
         tag = {
             "name": "MyUDT",
@@ -427,24 +455,20 @@ class TestUdtInstanceContextAwareness:
                 {"name": "Member1", "tagType": "AtomicTag", "valueSource": "memory"},
             ],
         }
-        issues = _lint_tag(tag)
-        dt_issues = _issues_with_code(issues, "MISSING_DATA_TYPE")
+        linter = _lint_tag(tag_linter, tag)
+        dt_issues = linter.issues_by_code.get("MISSING_DATA_TYPE", [])
         assert len(dt_issues) == 1
-        from ignition_lint.reporting import LintSeverity
-
         assert dt_issues[0].severity == LintSeverity.WARNING
 
-    def test_root_level_atomic_missing_data_type_is_warning(self):
+    def test_root_level_atomic_missing_data_type_is_warning(self, tag_linter):
         """Root-level AtomicTag: MISSING_DATA_TYPE should remain WARNING."""
         tag = {"name": "RootTag", "tagType": "AtomicTag", "valueSource": "memory"}
-        issues = _lint_tag(tag)
-        dt_issues = _issues_with_code(issues, "MISSING_DATA_TYPE")
+        linter = _lint_tag(tag_linter, tag)
+        dt_issues = linter.issues_by_code.get("MISSING_DATA_TYPE", [])
         assert len(dt_issues) == 1
-        from ignition_lint.reporting import LintSeverity
-
         assert dt_issues[0].severity == LintSeverity.WARNING
 
-    def test_atomic_under_udt_instance_folder_suppressed(self):
+    def test_atomic_under_udt_instance_folder_suppressed(self, tag_linter):
         """UdtInstance > Folder > AtomicTag: suppression propagates through folders."""
         tag = {
             "name": "Inst1",
@@ -464,10 +488,10 @@ class TestUdtInstanceContextAwareness:
                 }
             ],
         }
-        issues = _lint_tag(tag)
-        assert "MISSING_DATA_TYPE" not in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "MISSING_DATA_TYPE" not in linter.codes
 
-    def test_atomic_under_root_folder_is_warning(self):
+    def test_atomic_under_root_folder_is_warning(self, tag_linter):
         """Folder > AtomicTag (no UdtInstance ancestor): still WARNING."""
         tag = {
             "name": "TopFolder",
@@ -476,14 +500,12 @@ class TestUdtInstanceContextAwareness:
                 {"name": "Child", "tagType": "AtomicTag", "valueSource": "memory"},
             ],
         }
-        issues = _lint_tag(tag)
-        dt_issues = _issues_with_code(issues, "MISSING_DATA_TYPE")
+        linter = _lint_tag(tag_linter, tag)
+        dt_issues = linter.issues_by_code.get("MISSING_DATA_TYPE", [])
         assert len(dt_issues) == 1
-        from ignition_lint.reporting import LintSeverity
-
         assert dt_issues[0].severity == LintSeverity.WARNING
 
-    def test_missing_value_source_inside_udt_instance_suppressed(self):
+    def test_missing_value_source_inside_udt_instance_suppressed(self, tag_linter):
         """MISSING_VALUE_SOURCE inside UdtInstance should be suppressed entirely."""
         tag = {
             "name": "Inst1",
@@ -493,18 +515,18 @@ class TestUdtInstanceContextAwareness:
                 {"name": "Member1", "tagType": "AtomicTag", "dataType": "Int4"},
             ],
         }
-        issues = _lint_tag(tag)
-        assert "MISSING_VALUE_SOURCE" not in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "MISSING_VALUE_SOURCE" not in linter.codes
 
-    def test_missing_value_source_at_root_says_defaults_to_memory(self):
+    def test_missing_value_source_at_root_says_defaults_to_memory(self, tag_linter):
         """MISSING_VALUE_SOURCE at root should say 'defaults to memory'."""
         tag = {"name": "RootTag", "tagType": "AtomicTag", "dataType": "Int4"}
-        issues = _lint_tag(tag)
-        vs_issues = _issues_with_code(issues, "MISSING_VALUE_SOURCE")
+        linter = _lint_tag(tag_linter, tag)
+        vs_issues = linter.issues_by_code.get("MISSING_VALUE_SOURCE", [])
         assert len(vs_issues) == 1
         assert "defaults to memory" in vs_issues[0].message
 
-    def test_nested_udt_instance_missing_type_id_suppressed(self):
+    def test_nested_udt_instance_missing_type_id_suppressed(self, tag_linter):
         """UdtInstance child of UdtInstance missing typeId: suppressed (inherited)."""
         tag = {
             "name": "Inst1",
@@ -514,20 +536,18 @@ class TestUdtInstanceContextAwareness:
                 {"name": "NestedInst", "tagType": "UdtInstance"},
             ],
         }
-        issues = _lint_tag(tag)
-        assert "MISSING_TYPE_ID" not in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "MISSING_TYPE_ID" not in linter.codes
 
-    def test_root_udt_instance_missing_type_id_is_error(self):
+    def test_root_udt_instance_missing_type_id_is_error(self, tag_linter):
         """Root-level UdtInstance missing typeId: still ERROR."""
         tag = {"name": "NoType", "tagType": "UdtInstance"}
-        issues = _lint_tag(tag)
-        tid_issues = _issues_with_code(issues, "MISSING_TYPE_ID")
+        linter = _lint_tag(tag_linter, tag)
+        tid_issues = linter.issues_by_code.get("MISSING_TYPE_ID", [])
         assert len(tid_issues) == 1
-        from ignition_lint.reporting import LintSeverity
-
         assert tid_issues[0].severity == LintSeverity.ERROR
 
-    def test_complete_child_inside_udt_instance_no_missing_issues(self):
+    def test_complete_child_inside_udt_instance_no_missing_issues(self, tag_linter):
         """Complete AtomicTag inside UdtInstance should not trigger MISSING_DATA_TYPE
         or MISSING_VALUE_SOURCE."""
         tag = {
@@ -543,6 +563,122 @@ class TestUdtInstanceContextAwareness:
                 },
             ],
         }
-        issues = _lint_tag(tag)
-        assert "MISSING_DATA_TYPE" not in _codes(issues)
-        assert "MISSING_VALUE_SOURCE" not in _codes(issues)
+        linter = _lint_tag(tag_linter, tag)
+        assert "MISSING_DATA_TYPE" not in linter.codes
+        assert "MISSING_VALUE_SOURCE" not in linter.codes
+
+
+# ---------------------------------------------------------------------------
+# TestIssueIndex
+# ---------------------------------------------------------------------------
+
+
+class TestIssueIndex:
+    def test_codes_refreshed_on_next_lint(self, tmp_path):
+        linter = IgnitionTagLinter()
+        bad = tmp_path / "bad.json"
+        bad.write_text(json.dumps({"name": "Bad", "tagType": "InvalidType"}))
+        good = tmp_path / "good.json"
+        good.write_text(json.dumps({"name": "Inst1", "tagType": "UdtInstance"}))
+
+        linter.lint_file(str(bad))
+        assert "INVALID_TAG_TYPE" in linter.codes
+
+        linter.reset()
+        assert linter.codes == frozenset()
+
+        linter.lint_file(str(good))
+        assert linter.codes == {"MISSING_TYPE_ID"}
+        assert list(linter.issues_by_code) == ["MISSING_TYPE_ID"]
+        assert linter.issues_by_code["MISSING_TYPE_ID"] == linter.issues
+
+    def test_codes_follow_direct_issue_changes(self):
+        linter = IgnitionTagLinter()
+        linter.lint_data({"name": "Inst1", "tagType": "UdtInstance"})
+        assert linter.codes == {"MISSING_TYPE_ID"}
+
+        linter.lint_data({"name": "Bad", "tagType": "InvalidType"})
+        assert "INVALID_TAG_TYPE" in linter.codes
+
+        linter.issues.clear()
+        assert linter.codes == frozenset()
+        assert linter.issues_by_code == {}
+
+
+# ---------------------------------------------------------------------------
+# TestLintData
+# ---------------------------------------------------------------------------
+
+
+class TestLintData:
+    _TAG = {"name": "Bad", "tagType": "InvalidType"}
+
+    def test_matches_lint_file(self, tmp_path):
+        raw_text = json.dumps(self._TAG, indent=2)
+        path = tmp_path / "tags.json"
+        path.write_text(raw_text)
+
+        from_file = IgnitionTagLinter()
+        from_file.lint_file(str(path))
+        in_memory = IgnitionTagLinter()
+        in_memory.lint_data(self._TAG, str(path), raw_text)
+
+        assert from_file.issues == in_memory.issues
+        assert in_memory.issues_by_code["INVALID_TAG_TYPE"][0].line_number == 3
+
+    def test_stats_match_lint_file(self, tmp_path):
+        path = tmp_path / "tags.json"
+        path.write_text(json.dumps(self._TAG))
+        (tmp_path / "broken.json").write_text("{")
+
+        from_file = IgnitionTagLinter()
+        from_file.lint_file(str(path))
+        in_memory = IgnitionTagLinter()
+        in_memory.lint_data(self._TAG, str(path))
+
+        assert in_memory.tag_stats == from_file.tag_stats
+        assert in_memory.tag_stats["total_files"] == 1
+        from_file.lint_file(str(tmp_path / "broken.json"))
+        assert from_file.tag_stats["total_files"] == 2
+
+    def test_line_numbers_need_raw_text(self, tag_linter):
+        linter = _lint_tag(tag_linter, self._TAG)
+        issue = linter.issues_by_code["INVALID_TAG_TYPE"][0]
+        assert issue.file_path == "<memory>"
+        assert issue.line_number is None
+
+    def test_invalid_json_uses_stdlib_message(self, tmp_path):
+        path = tmp_path / "tags.json"
+        path.write_text('{"name": "Bad",}')
+        linter = IgnitionTagLinter()
+        assert not linter.lint_file(str(path))
+        issue = linter.issues_by_code["INVALID_JSON"][0]
+        assert issue.suggestion == (
+            "Line 1: Expecting property name enclosed in double quotes"
+        )
+
+    def test_relinting_reports_issues_again(self):
+        linter = IgnitionTagLinter()
+        linter.lint_data(self._TAG, "tags.json")
+        first = list(linter.issues)
+        assert first
+
+        linter.lint_data(self._TAG, "tags.json")
+        assert linter.issues[len(first) :] == first
+
+        linter.reset()
+        linter.lint_data(self._TAG, "tags.json")
+        assert linter.issues == first
+
+    def test_shared_event_id_reported_once(self, tag_linter):
+        script = "x = 1\n\tif x:\n  pass\n"
+        tag = _atomic_tag(
+            eventScripts=[
+                {"eventid": "valueChanged", "script": script},
+                {"eventid": "valueChanged", "script": script},
+            ]
+        )
+        tag_linter.lint_data(tag)
+        keys = [(i.code, i.component_path) for i in tag_linter.issues]
+        assert keys
+        assert len(keys) == len(set(keys))
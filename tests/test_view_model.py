@@ -160,3 +160,27 @@ def test_convenience_properties():
     model = build_view_model(view_data, "test/view.json")
     assert len(model.all_expression_text) == 1
     assert len(model.all_script_text) == 1
+
+
+def test_tree_walk_follows_document_order():
+    def comp(name, *children, **extra):
+        return {"type": f"ia.{name}", "children": list(children), **extra}
+
+    embedded = {"root": comp("embedded.root")}
+    view_data = {
+        "root": comp(
+            "container.flex",
+            comp("display.a", comp("display.a1")),
+            comp("display.b", **embedded),
+            comp("display.c"),
+        )
+    }
+    model = build_view_model(view_data, "test/view.json")
+    assert [c["type"] for c in model.components] == [
+        "ia.container.flex",
+        "ia.display.a",
+        "ia.display.a1",
+        "ia.display.b",
+        "ia.embedded.root",
+        "ia.display.c",
+    ]
@@ -6,35 +6,97 @@ Enables real-time linting in VS Code and other LSP-compatible editors
 
 import json
 import sys
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, BinaryIO, ClassVar
 
+from ignition_lint._json import dumps, loads
 from ignition_lint.perspective.linter import IgnitionPerspectiveLinter
+from ignition_lint.reporting import LintSeverity
+
+
+def _read_messages(stream: BinaryIO) -> Iterator[tuple[bytes, bool]]:
+    """Yield ``(body, framed)`` for each request on *stream*.
+
+    Requests are either one JSON document per line or, as in the LSP base
+    protocol, a header block carrying ``Content-Length`` followed by a blank
+    line and the body. Blank lines between requests are ignored, and a
+    message cut off by end of input is dropped.
+    """
+    while line := stream.readline():
+        if not line.strip():
+            continue
+        if not line.startswith(b"Content-"):
+            yield line, False
+            continue
+        length = None
+        header = line
+        while header.strip():
+            name, _, value = header.partition(b":")
+            if name.strip().lower() == b"content-length":
+                try:
+                    length = int(value)
+                except ValueError:
+                    length = None
+            header = stream.readline()
+        if not header:
+            return
+        if length is None:
+            # No usable length; let the caller report the bad request
+            yield line, False
+            continue
+        body = stream.read(length)
+        if len(body) < length:
+            return
+        yield body, True
+
+
+def _write_message(message: dict[str, Any], framed: bool = False) -> None:
+    """Write one JSON response in the request's framing and flush it."""
+    payload = dumps(message)
+    if framed:
+        data = b"Content-Length: %d\r\n\r\n" % len(payload) + payload
+    else:
+        data = payload + b"\n"
+    out = sys.stdout.buffer
+    out.write(data)
+    out.flush()
 
 
 class IgnitionLSPServer:
+    # Every LintSeverity maps to an LSP DiagnosticSeverity
+    _SEVERITY_MAP: ClassVar[dict[LintSeverity, int]] = {
+        LintSeverity.ERROR: 1,  # LSP Error
+        LintSeverity.WARNING: 2,  # LSP Warning
+        LintSeverity.INFO: 3,  # LSP Information
+        LintSeverity.STYLE: 4,  # LSP Hint
+    }
+
     def __init__(self):
         self.linter = IgnitionPerspectiveLinter()
+        self.linter.warmup()
 
     def lint_document(self, file_path: str, content: str) -> list[dict[str, Any]]:
         """Convert linter issues to LSP diagnostics format"""
-        import os
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write(content)
-            temp_path = f.name
-
         try:
-            severity_map = {
-                "error": 1,  # LSP Error
-                "warning": 2,  # LSP Warning
-                "info": 3,  # LSP Information
-                "style": 4,  # LSP Hint
-            }
-
-            # lint_file returns bool; issues accumulate in self.linter.issues
-            self.linter.issues.clear()
-            self.linter.lint_file(temp_path)
+            try:
+                view_data = loads(content)
+            except json.JSONDecodeError as e:
+                return [
+                    {
+                        "range": {
+                            "start": {"line": e.lineno - 1, "character": 0},
+                            "end": {"line": e.lineno - 1, "character": 100},
+                        },
+                        "severity": 1,
+                        "message": f"Invalid JSON format: {e}",
+                        "source": "ignition-perspective-linter",
+                        "code": "INVALID_JSON",
+                    }
+                ]
+
+            # lint_data returns bool; issues accumulate in self.linter.issues
+            self.linter.reset()
+            self.linter.lint_data(view_data, file_path, raw_text=content)
             diagnostics = []
 
             for issue in self.linter.issues:
@@ -44,7 +106,7 @@ class IgnitionLSPServer:
                         "start": {"line": line, "character": 0},
                         "end": {"line": line, "character": 100},
                     },
-                    "severity": severity_map.get(issue.severity.value, 2),
+                    "severity": self._SEVERITY_MAP[issue.severity],
                     "message": issue.message,
                     "source": "ignition-perspective-linter",
                     "code": issue.code or "unknown",
@@ -65,21 +127,16 @@ class IgnitionLSPServer:
                     "source": "ignition-perspective-linter",
                 }
             ]
-        finally:
-            try:
-                os.unlink(temp_path)
-            except Exception:
-                pass
 
 
 def main():
     """Simple stdio-based LSP server for agent integration"""
     server = IgnitionLSPServer()
 
-    for line in sys.stdin:
+    for body, framed in _read_messages(sys.stdin.buffer):
         request = None
         try:
-            request = json.loads(line.strip())
+            request = loads(body)
 
             if request.get("method") == "lint":
                 file_path = request["params"]["uri"]
@@ -90,14 +147,14 @@ def main():
                     "id": request.get("id"),
                     "result": {"diagnostics": diagnostics},
                 }
-                print(json.dumps(response))
+                _write_message(response, framed)
 
         except Exception as e:
             error_response = {
                 "id": (request or {}).get("id"),
                 "error": {"code": -1, "message": str(e)},
             }
-            print(json.dumps(error_response))
+            _write_message(error_response, framed)
 
 
 if __name__ == "__main__":
@@ -10,7 +10,8 @@ transforms or event handler payloads.
 from __future__ import annotations
 
 import argparse
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from ignition_lint.reporting import LintIssue, LintSeverity
@@ -23,6 +24,16 @@ SEVERITY_ICONS = {
     LintSeverity.STYLE: "💡",
 }
 
+# Lines starting with these keep the current indent level
+_PASSTHROUGH_KEYWORDS = ("return", "break", "continue", "pass")
+
+# Tab prefixes for common nesting depths; deeper levels are built on demand
+_TABS = tuple("\t" * depth for depth in range(32))
+
+
+def _tab_prefix(depth: int) -> str:
+    return _TABS[depth] if depth < len(_TABS) else "\t" * depth
+
 
 def format_script_properly(script: str) -> str:
     """Produce a tab-indented version of the script similar to Ignition's editor."""
@@ -37,41 +48,71 @@ def format_script_properly(script: str) -> str:
             continue
 
         if stripped.endswith(":"):
-            formatted_lines.append("\t" * current_indent + stripped)
+            formatted_lines.append(_tab_prefix(current_indent) + stripped)
             current_indent += 1
         elif stripped in {"else:", "except:", "finally:"} or stripped.startswith(
             ("elif ", "except ")
         ):
             current_indent = max(0, current_indent - 1)
-            formatted_lines.append("\t" * current_indent + stripped)
+            formatted_lines.append(_tab_prefix(current_indent) + stripped)
             if stripped.endswith(":"):
                 current_indent += 1
-        elif any(
-            stripped.startswith(keyword)
-            for keyword in ("return", "break", "continue", "pass")
-        ):
-            formatted_lines.append("\t" * current_indent + stripped)
+        elif stripped.startswith(_PASSTHROUGH_KEYWORDS):
+            formatted_lines.append(_tab_prefix(current_indent) + stripped)
         else:
             original_indent = len(line) - len(line.lstrip("\t"))
             if original_indent < current_indent:
                 current_indent = original_indent
-            formatted_lines.append("\t" * current_indent + stripped)
+            formatted_lines.append(_tab_prefix(current_indent) + stripped)
 
     return "\n".join(formatted_lines)
 
 
-def validate_jython_in_binding(binding_config: dict) -> list[LintIssue]:
-    """Validate any script transforms defined in a binding config dictionary."""
-    validator = JythonValidator()
-    all_issues: list[LintIssue] = []
-
-    for index, transform in enumerate(binding_config.get("transforms", [])):
-        if transform.get("type") != "script" or "code" not in transform:
-            continue
+def _validate_pair(pair: tuple[str, str]) -> list[LintIssue]:
+    # Parse results are cached at module level, so a fresh validator per
+    # script is cheap and no state is shared between callers or threads
+    context, script = pair
+    return JythonValidator().validate_script(script, context=context)
+
+
+def validate_many(
+    scripts: Iterable[tuple[str, str]], max_workers: int = 1
+) -> list[list[LintIssue]]:
+    """Validate ``(context, script)`` pairs and return one issue list per pair.
+
+    Scripts are validated inline unless ``max_workers`` is above 1, in which
+    case they are spread over that many worker processes (parsing holds the
+    GIL). Pool startup and pickling only pay off for very large batches, and
+    spawn-based platforms need the caller to guard its ``__main__`` module.
+    Results are in input order either way.
+    """
+    pairs = list(scripts)
+    if max_workers <= 1:
+        return [_validate_pair(pair) for pair in pairs]
+
+    chunksize = max(1, len(pairs) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_validate_pair, pairs, chunksize=chunksize))
+
+
+def validate_jython_in_binding(
+    binding_config: dict, max_workers: int = 1
+) -> list[LintIssue]:
+    """Validate any script transforms defined in a binding config dictionary.
+
+    ``max_workers`` is passed to :func:`validate_many`.
+    """
+    transforms = [
+        (index, transform["code"])
+        for index, transform in enumerate(binding_config.get("transforms", []))
+        if transform.get("type") == "script" and "code" in transform
+    ]
+    results = validate_many(
+        ((f"transform[{index}]", code) for index, code in transforms), max_workers
+    )
 
-        issues = validator.validate_script(
-            transform["code"], context=f"transform[{index}]"
-        )
+    all_issues: list[LintIssue] = []
+    for (index, _), issues in zip(transforms, results, strict=True):
         for issue in issues:
             issue.metadata["transformIndex"] = str(index)
         all_issues.extend(issues)
@@ -79,15 +120,11 @@ def validate_jython_in_binding(binding_config: dict) -> list[LintIssue]:
     return all_issues
 
 
-def validate_jython_in_events(events_config: dict) -> list[LintIssue]:
-    """Validate script handlers nested inside an events configuration dictionary."""
-    validator = JythonValidator()
-    all_issues: list[LintIssue] = []
-
+def _iter_event_scripts(events_config: dict) -> Iterator[tuple[str, str, int, str]]:
+    """Yield ``(category, name, index, script)`` for every script handler."""
     for category, handlers in events_config.items():
         if not isinstance(handlers, dict):
             continue
-
         for name, handler_config in handlers.items():
             handler_list: Iterable[dict] = (
                 handler_config if isinstance(handler_config, list) else [handler_config]
@@ -95,16 +132,33 @@ def validate_jython_in_events(events_config: dict) -> list[LintIssue]:
             for idx, handler in enumerate(handler_list):
                 if not isinstance(handler, dict) or handler.get("type") != "script":
                     continue
+                script = handler.get("config", {}).get("script", "")
+                yield category, name, idx, script
+
+
+def validate_jython_in_events(
+    events_config: dict, max_workers: int = 1
+) -> list[LintIssue]:
+    """Validate script handlers nested inside an events configuration dictionary.
+
+    ``max_workers`` is passed to :func:`validate_many`.
+    """
+    handlers = list(_iter_event_scripts(events_config))
+    results = validate_many(
+        (
+            (f"events.{category}.{name}[{idx}]", script)
+            for category, name, idx, script in handlers
+        ),
+        max_workers,
+    )
 
-                script_code = handler.get("config", {}).get("script", "")
-                issues = validator.validate_script(
-                    script_code, context=f"events.{category}.{name}[{idx}]"
-                )
-                for issue in issues:
-                    issue.metadata["eventCategory"] = category
-                    issue.metadata["eventName"] = name
-                    issue.metadata["handlerIndex"] = str(idx)
-                all_issues.extend(issues)
+    all_issues: list[LintIssue] = []
+    for (category, name, idx, _), issues in zip(handlers, results, strict=True):
+        for issue in issues:
+            issue.metadata["eventCategory"] = category
+            issue.metadata["eventName"] = name
+            issue.metadata["handlerIndex"] = str(idx)
+        all_issues.extend(issues)
 
     return all_issues
 
@@ -154,8 +208,7 @@ def main() -> int:
     args = parser.parse_args()
 
     script, context = _load_script(args)
-    validator = JythonValidator()
-    issues = validator.validate_script(script, context=context)
+    issues = JythonValidator().validate_script(script, context=context)
 
     print("🐍 JYTHON VALIDATION RESULTS")
     print("=" * 50)